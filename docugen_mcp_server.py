@@ -5,10 +5,21 @@ Built with FastMCP following official MCP SDK patterns
 """
 
 import os
+import re
+import csv
+import io
 import json
+import random
+import asyncio
+import functools
 import logging
+import platform
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, AsyncIterator
+from typing import Any, Dict, List, Optional, Tuple, AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 
@@ -16,19 +27,450 @@ from mcp.server.fastmcp import FastMCP, Context
 from mcp.types import TextContent
 from pydantic import BaseModel, Field
 
+import httplib2
+import google_auth_httplib2
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+from googleapiclient.model import JsonModel
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Use uvloop's faster event loop where available
+if uvloop is not None and platform.system() != 'Windows':
+    uvloop.install()
+
 # Google Sheets API scope
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
 
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+class _OrjsonModel(JsonModel):
+    """JsonModel that encodes/decodes with orjson's C implementation
+
+    Large values payloads (values_update, values_batch_update, csv
+    imports) spend most of their client-side CPU in JSON; orjson cuts
+    that several-fold.
+    """
+
+    def serialize(self, body_value):
+        if (isinstance(body_value, dict) and 'data' not in body_value
+                and self._data_wrapper):
+            body_value = {'data': body_value}
+        # OPT_SERIALIZE_NUMPY lets in-process callers hand numpy arrays
+        # straight to values payloads without a Python-list detour
+        return orjson.dumps(body_value, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def deserialize(self, content):
+        body = orjson.loads(content)
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
+# Fall back to googleapiclient's stdlib-json model when orjson is missing
+_API_MODEL = _OrjsonModel() if orjson is not None else None
+
+@functools.lru_cache(maxsize=256)
+def _hex_rgb(hex_color: str) -> Dict[str, float]:
+    """Convert a hex color like '#4285F4' to a Sheets API RGB dict"""
+    value = int(hex_color.lstrip('#'), 16)
+    return {
+        'red': ((value >> 16) & 0xFF) / 255,
+        'green': ((value >> 8) & 0xFF) / 255,
+        'blue': (value & 0xFF) / 255
+    }
+
+@functools.lru_cache(maxsize=4096)
+def _col_letter(index: int) -> str:
+    """Convert a 0-based column index to its A1 letter ('AA' for 26, etc.)"""
+    letters = ''
+    while index >= 0:
+        letters = chr(65 + index % 26) + letters
+        index = index // 26 - 1
+    return letters
+
+# Matches 'Sheet1!A1:B100', 'A1:B100' or a single cell
+# batchUpdate request kinds that can change the sheet-name -> id mapping
+_STRUCTURAL_REQUEST_KEYS = frozenset({
+    'addSheet', 'deleteSheet', 'duplicateSheet', 'updateSheetProperties',
+    'insertDimension', 'deleteDimension', 'moveDimension'
+})
+
+_A1_RE = re.compile(r"^(?:'([^']+)'|([^!]+))!")
+
+def _split_a1(rng: str) -> tuple:
+    """Split an A1 reference into (sheet_name, cell_part) in one pass
+
+    Handles quoted sheet names like "'My Sheet'!A1:B2"; references with
+    no sheet prefix fall back to 'Sheet1' with the input unchanged.
+    """
+    if rng[:1] != "'":
+        # Common unquoted case: one C-level scan, no regex machinery
+        head, sep, rest = rng.partition('!')
+        return (head, rest) if sep else ('Sheet1', rng)
+    match = _A1_RE.match(rng)
+    if match:
+        return match.group(1) or match.group(2), rng[match.end():]
+    return 'Sheet1', rng
+
+def _col_index(letters: str) -> int:
+    """0-based column index for a column letter run ('A' -> 0, 'AA' -> 26)"""
+    index = 0
+    for ch in letters:
+        index = index * 26 + (ord(ch) - 64)
+    return index - 1
+
+# updateBorders applies the same border to every side
+_BORDER_SIDES = ('top', 'bottom', 'left', 'right', 'innerHorizontal', 'innerVertical')
+
+# Two-hex-digit channel -> float; skips int(x, 16) parsing. Lowercase
+# keys only - callers normalize with .lower() so '#aFbBcC' works too
+_HEX2F = {f'{i:02x}': i / 255 for i in range(256)}
+
+def _build_cells_merge_request(sheet_id: int, range: str, merge_type: str = 'MERGE_ALL') -> dict:
+    return {
+        'mergeCells': {
+            'range': _grid_range(sheet_id, range),
+            'mergeType': merge_type
+        }
+    }
+
+def _build_cells_unmerge_request(sheet_id: int, range: str) -> dict:
+    return {
+        'unmergeCells': {
+            'range': _grid_range(sheet_id, range)
+        }
+    }
+
+def _build_borders_update_request(
+    sheet_id: int,
+    range: str,
+    border_style: str = 'SOLID',
+    border_width: int = 1,
+    border_color: str = '#000000'
+) -> dict:
+    color = border_color.lstrip('#').lower()
+    border = {
+        'style': border_style,
+        'width': border_width,
+        'color': {
+            'red': _HEX2F[color[0:2]],
+            'green': _HEX2F[color[2:4]],
+            'blue': _HEX2F[color[4:6]]
+        }
+    }
+    return {
+        'updateBorders': {
+            'range': _grid_range(sheet_id, range),
+            **{side: border for side in _BORDER_SIDES}
+        }
+    }
+
+def _build_validation_add_request(
+    sheet_id: int,
+    range: str,
+    validation_type: str,
+    values: Optional[List[str]] = None,
+    min_value: Optional[float] = None,
+    max_value: Optional[float] = None
+) -> dict:
+    validation = {
+        'condition': {
+            'type': validation_type
+        },
+        'showCustomUi': True,
+        'strict': True
+    }
+    if validation_type == 'ONE_OF_LIST' and values:
+        validation['condition']['values'] = [{'userEnteredValue': v} for v in values]
+    elif validation_type == 'NUMBER_BETWEEN':
+        validation['condition']['values'] = [
+            {'userEnteredValue': str(min_value)},
+            {'userEnteredValue': str(max_value)}
+        ]
+    return {
+        'setDataValidation': {
+            'range': _grid_range(sheet_id, range),
+            'rule': validation
+        }
+    }
+
+def _build_conditional_format_add_request(
+    sheet_id: int,
+    range: str,
+    rule_type: str,
+    condition: Dict[str, Any],
+    format_options: Dict[str, Any]
+) -> dict:
+    return {
+        'addConditionalFormatRule': {
+            'rule': {
+                'ranges': [_grid_range(sheet_id, range)],
+                'booleanRule': {
+                    'condition': {
+                        'type': rule_type,
+                        'values': [{'userEnteredValue': str(v)} for v in condition.get('values', [])]
+                    },
+                    'format': format_options
+                }
+            },
+            'index': 0
+        }
+    }
+
+def _build_named_range_add_request(sheet_id: int, range: str, name: str = '') -> dict:
+    return {
+        'addNamedRange': {
+            'namedRange': {
+                'name': name,
+                'range': _grid_range(sheet_id, range)
+            }
+        }
+    }
+
+_MERGEABLE_DIM_KEYS = frozenset({
+    'updateDimensionProperties', 'addDimensionGroup', 'autoResizeDimensions'
+})
+
+def _merge_dimension_requests(
+    requests: List[dict]
+) -> Tuple[List[dict], List[Optional[int]]]:
+    """Coalesce contiguous same-property dimension requests in a batch
+
+    Agents tend to queue rows_hide(1,3) then rows_hide(4,5); both turn
+    into updateDimensionProperties over touching index ranges. A
+    request collapses into the one immediately before it when type,
+    sheet, dimension and properties all match and the ranges overlap
+    or abut. Only adjacent requests merge - pulling a later request
+    past an intervening one could reorder conflicting mutations (hide,
+    unhide, hide over overlapping rows must stay three requests).
+
+    Returns the merged list plus one entry per original request: its
+    index into the merged list, or None when it was folded into its
+    predecessor. Callers use the map to keep reply lists positional.
+    """
+    if len(requests) < 2:
+        return requests, list(range(len(requests)))
+
+    def _mergeable(request: dict):
+        """(signature, range) when the request can merge, else None"""
+        key = next(iter(request))
+        if key not in _MERGEABLE_DIM_KEYS or len(request) != 1:
+            return None
+        inner = request[key]
+        range_key = 'dimensions' if key == 'autoResizeDimensions' else 'range'
+        rng = inner.get(range_key)
+        if not rng or 'startIndex' not in rng or 'endIndex' not in rng:
+            return None
+        sig = (key, rng.get('sheetId'), rng.get('dimension'),
+               inner.get('fields'), repr(inner.get('properties')))
+        return sig, rng
+
+    merged: List[dict] = [requests[0]]
+    reply_map: List[Optional[int]] = [0]
+    prev_info = _mergeable(requests[0])
+    for request in requests[1:]:
+        info = _mergeable(request)
+        if info is not None and prev_info is not None:
+            sig, rng = info
+            prev_sig, prev_rng = prev_info
+            if (sig == prev_sig
+                    and rng['startIndex'] <= prev_rng['endIndex']
+                    and rng['endIndex'] >= prev_rng['startIndex']):
+                prev_rng['startIndex'] = min(prev_rng['startIndex'], rng['startIndex'])
+                prev_rng['endIndex'] = max(prev_rng['endIndex'], rng['endIndex'])
+                reply_map.append(None)
+                continue
+        merged.append(request)
+        reply_map.append(len(merged) - 1)
+        prev_info = info
+    return merged, reply_map
+
+# Shared property payloads for dimension requests; these are only ever
+# serialized, never mutated, so one instance serves every call
+_HIDDEN_TRUE = {'hiddenByUser': True}
+_HIDDEN_FALSE = {'hiddenByUser': False}
+
+def _dimension_range(sheet_id: int, dimension: str, start: int, end: int) -> dict:
+    """Build a DimensionRange for ROWS or COLUMNS requests"""
+    return {
+        'sheetId': sheet_id,
+        'dimension': dimension,
+        'startIndex': start,
+        'endIndex': end
+    }
+
+def _build_autofit_request(
+    sheet_id: int, dimension: str,
+    start: Optional[int] = None, end: Optional[int] = None
+) -> dict:
+    """Build an autoResizeDimensions request; omitted bounds fit the whole dimension"""
+    rng: Dict[str, Any] = {'sheetId': sheet_id, 'dimension': dimension}
+    if start is not None:
+        rng['startIndex'] = start
+    if end is not None:
+        rng['endIndex'] = end
+    return {'autoResizeDimensions': {'dimensions': rng}}
+
+def _dimension_props_request(
+    sheet_id: int, dimension: str, start: int, end: int,
+    fields: str, props: dict
+) -> dict:
+    """Build an updateDimensionProperties request over one range"""
+    return {
+        'updateDimensionProperties': {
+            'range': _dimension_range(sheet_id, dimension, start, end),
+            'properties': props,
+            'fields': fields
+        }
+    }
+
+def _sheet_props_request(sheet_id: int, fields: str, **props: Any) -> dict:
+    """Build an updateSheetProperties request patching the given fields"""
+    return {
+        'updateSheetProperties': {
+            'properties': {'sheetId': sheet_id, **props},
+            'fields': fields
+        }
+    }
+
+# Request builders bulk_format can fuse into one batchUpdate
+_FORMAT_REQUEST_BUILDERS = {
+    'cells_merge': _build_cells_merge_request,
+    'cells_unmerge': _build_cells_unmerge_request,
+    'borders_update': _build_borders_update_request,
+    'validation_add': _build_validation_add_request,
+    'conditional_format_add': _build_conditional_format_add_request,
+    'named_range_add': _build_named_range_add_request,
+}
+
+_CELL_SPAN_RE = re.compile(r"^([A-Z]*)(\d*)(?::([A-Z]*)(\d*))?$")
+_CELL_RE = re.compile(r"^([A-Z]+)(\d+)$")
+def _outer_is_arrayformula(formula: str) -> bool:
+    """True when the formula's outermost call is ARRAYFORMULA
+
+    Checks only the leading identifier after '=', so a multi-KB formula
+    costs a dozen character reads and 'ARRAYFORMULA' buried in a string
+    argument no longer counts as already wrapped.
+    """
+    i = 1 if formula[:1] == '=' else 0
+    j = i
+    while j < len(formula) and formula[j].isalpha():
+        j += 1
+    return formula[i:j].upper() == 'ARRAYFORMULA'
+
+def _parse_cell(cell_ref: str) -> tuple:
+    """Parse a single cell like 'AA10' into 0-based (row, column)"""
+    match = _CELL_RE.match(cell_ref)
+    if not match:
+        raise ValueError(f"Invalid cell reference: {cell_ref}")
+    return int(match.group(2)) - 1, _col_index(match.group(1))
+
+@functools.lru_cache(maxsize=2048)
+def _parse_cell_span(cell_part: str) -> tuple:
+    """Parse an A1 cell part into half-open (start_row, end_row, start_col, end_col)
+
+    Accepts cells ('A1', 'A1:B2'), column-only spans ('A:C'), row-only
+    spans ('1:5') and open-ended bounds ('A1:B'); lowercase and '$'
+    anchors are normalized away. Omitted bounds come back as None, and
+    a part that still isn't A1 notation raises ValueError. Memoized:
+    coalesced batches parse the same handful of range strings over and
+    over, and the immutable tuple is safe to share.
+    """
+    match = _CELL_SPAN_RE.match(cell_part.replace('$', '').upper())
+    if match:
+        start_col, start_row, end_col, end_row = match.groups()
+        if end_col is None and end_row is None:
+            # No colon: only a full cell like 'A1' stands alone
+            valid = bool(start_col and start_row)
+            end_col, end_row = start_col, start_row
+        else:
+            valid = bool(start_col or start_row) and bool(end_col or end_row)
+        if valid:
+            return (
+                int(start_row) - 1 if start_row else None,
+                int(end_row) if end_row else None,
+                _col_index(start_col) if start_col else None,
+                _col_index(end_col) + 1 if end_col else None
+            )
+    raise ValueError(f"Invalid A1 range: {cell_part}")
+
+def _grid_range(sheet_id: int, range_str: str) -> dict:
+    """Build a GridRange (half-open indices) from an A1 reference
+
+    Bounds a span omits stay out of the dict - the API treats absent
+    indices as unbounded, so 'A:C' spans those columns top to bottom.
+    An empty cell part ('Sheet1!') covers the whole sheet; anything
+    unparseable raises ValueError rather than silently widening to the
+    sheet.
+    """
+    cell_part = _split_a1(range_str)[1]
+    grid = {'sheetId': sheet_id}
+    if not cell_part:
+        return grid
+    start_row, end_row, start_col, end_col = _parse_cell_span(cell_part)
+    if start_row is not None:
+        grid['startRowIndex'] = start_row
+    if end_row is not None:
+        grid['endRowIndex'] = end_row
+    if start_col is not None:
+        grid['startColumnIndex'] = start_col
+    if end_col is not None:
+        grid['endColumnIndex'] = end_col
+    return grid
+
+_A1_WINDOW_RE = re.compile(r"^(?:([^!]+)!)?([A-Z]+)(\d+)(?::([A-Z]+)(\d+))?$")
+
+# Writes larger than this many cells are split into row chunks
+_VALUES_CELL_LIMIT = 200_000
+_VALUES_CHUNK_ROWS = 5000
+
+def _chunked(rows: List[List[Any]], size: int):
+    """Yield consecutive row slices of at most `size` rows"""
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+def _shift_a1_rows(range_str: str, offset: int) -> str:
+    """Re-anchor an A1 range `offset` rows below its start cell"""
+    match = _A1_WINDOW_RE.match(range_str)
+    if not match or not offset:
+        return range_str
+    sheet, start_col, start_row, _end_col, _end_row = match.groups()
+    prefix = f"{sheet}!" if sheet else ''
+    # A single anchor cell is enough - values.update extends from it
+    return f"{prefix}{start_col}{int(start_row) + offset}"
+
+@functools.lru_cache(maxsize=8192)
+def _a1(sheet: str, start_col: str, start_row: int,
+        end_col: Optional[str], end_row: Optional[int]) -> str:
+    """Build an A1 reference string, memoized for bulk range generation"""
+    parts = (sheet, '!', start_col, str(start_row))
+    if end_row and end_col:
+        parts += (':', end_col, str(end_row))
+    return ''.join(parts)
+
 # ============================================================================
 # DATA MODELS
 # ============================================================================
@@ -50,12 +492,12 @@ class CellRange(BaseModel):
     
     def to_a1(self) -> str:
         """Convert to A1 notation"""
-        if self.end_row and self.end_col:
-            return f"{self.sheet}!{self.start_col}{self.start_row}:{self.end_col}{self.end_row}"
-        return f"{self.sheet}!{self.start_col}{self.start_row}"
+        return _a1(self.sheet, self.start_col, self.start_row, self.end_col, self.end_row)
 
 class ChartSpec(BaseModel):
     """Specification for creating a chart"""
+    model_config = {'frozen': True, 'validate_assignment': False}
+
     chart_type: str = Field(default="COLUMN", description="Chart type: LINE, BAR, COLUMN, PIE, SCATTER")
     data_range: str = Field(description="Data range in A1 notation")
     title: str = Field(default="Chart", description="Chart title")
@@ -65,6 +507,34 @@ class ChartSpec(BaseModel):
 # GOOGLE SHEETS CLIENT
 # ============================================================================
 
+class _TokenBucket:
+    """Client-side token bucket smoothing write bursts below the API quota
+
+    Refills continuously; acquire() sleeps just long enough for the next
+    token instead of letting a burst hit the server and bounce as 429s.
+    """
+
+    def __init__(self, capacity: int, refill_per_sec: float):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.refill_per_sec
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.refill_per_sec)
+
 class GoogleSheetsClient:
     """Manages Google Sheets API authentication and services"""
     
@@ -72,8 +542,40 @@ class GoogleSheetsClient:
         self.creds = None
         self.sheets_service = None
         self.drive_service = None
+        self._ss = None
+        self._ss_values = None
+        self._ss_dm = None
         self.current_spreadsheet_id = None
-    
+        self._sheet_id_cache: Dict[tuple, int] = {}
+        self._sheet_props: Dict[tuple, dict] = {}
+        self._sheet_cache_fetched: Dict[str, float] = {}
+        self._sheet_cache_locks: Dict[str, asyncio.Lock] = {}
+        self._pending_requests: Dict[str, List[dict]] = {}
+        self._batching = False
+        self._refresh_lock = asyncio.Lock()
+        self._saved_refresh_token = None
+        self._values_queue: Dict[tuple, List[dict]] = {}
+        self._values_futures: Dict[tuple, List[asyncio.Future]] = {}
+        self._values_flush_tasks: Dict[tuple, asyncio.Task] = {}
+        # Opt-in coalescing window for immediate mutations; 0 disables
+        self._batch_window = float(os.getenv('DOCUGEN_BATCH_WINDOW_MS', '0')) / 1000.0
+        self._window_queue: Dict[str, List[dict]] = {}
+        self._window_futures: Dict[str, List[asyncio.Future]] = {}
+        self._window_flush_tasks: Dict[str, asyncio.Task] = {}
+        self._meta_cache: Dict[str, tuple] = {}
+        self._values_cache: Dict[str, Dict[tuple, List[List[Any]]]] = {}
+        self._fields_cache: Dict[tuple, tuple] = {}
+        self._dm_cache: Dict[str, List[Dict[str, Any]]] = {}
+        self._meta_cache_hits = 0
+        self._meta_cache_misses = 0
+        self._thread_local = threading.local()
+        # Bounds in-flight API calls; chosen well under the 60-writes/min
+        # per-user quota so a wide gather doesn't trip rate limits
+        self._exec_sem = asyncio.Semaphore(8)
+        # Preventative half of the 429 handling: pace writes at the
+        # 60-per-minute per-user quota instead of bursting into it
+        self._write_quota = _TokenBucket(60, 1.0)
+
     async def authenticate(self) -> bool:
         """Authenticate with Google APIs"""
         token_path = Path.home() / '.docugen' / 'token.json'
@@ -86,41 +588,529 @@ class GoogleSheetsClient:
         # Refresh or get new token
         if not self.creds or not self.creds.valid:
             if self.creds and self.creds.expired and self.creds.refresh_token:
-                self.creds.refresh(Request())
+                await asyncio.to_thread(self.creds.refresh, Request())
             else:
                 creds_path = os.getenv('GOOGLE_OAUTH_PATH')
                 if not creds_path:
                     raise ValueError("GOOGLE_OAUTH_PATH environment variable not set")
-                
+
                 flow = InstalledAppFlow.from_client_secrets_file(creds_path, SCOPES)
-                self.creds = flow.run_local_server(port=0)
-            
+                self.creds = await asyncio.to_thread(flow.run_local_server, port=0)
+
             # Save token
-            with open(token_path, 'w') as token:
-                token.write(self.creds.to_json())
-        
-        # Build services
-        self.sheets_service = build('sheets', 'v4', credentials=self.creds)
-        self.drive_service = build('drive', 'v3', credentials=self.creds)
+            await asyncio.to_thread(token_path.write_text, self.creds.to_json())
+
+        self._saved_refresh_token = self.creds.refresh_token
+
+        # Build services over a pooled, keep-alive transport
+        # static_discovery uses the discovery docs bundled with
+        # google-api-python-client, skipping two HTTPS fetches at startup
+        self.sheets_service = build(
+            'sheets', 'v4',
+            http=self._authorized_http(),
+            requestBuilder=self._build_request,
+            model=_API_MODEL,
+            static_discovery=True
+        )
+        self.drive_service = build(
+            'drive', 'v3',
+            http=self._authorized_http(),
+            requestBuilder=self._build_request,
+            model=_API_MODEL,
+            static_discovery=True
+        )
+
+        # Resource accessors build a fresh object on every call; cache
+        # the three hot ones once
+        self._ss = self.sheets_service.spreadsheets()
+        self._ss_values = self._ss.values()
+        self._ss_dm = self._ss.developerMetadata()
         
         logger.info("Successfully authenticated with Google APIs")
         return True
     
-    def get_sheet_id_by_name(self, spreadsheet_id: str, sheet_name: str) -> Optional[int]:
-        """Get sheet ID from sheet name"""
+    # Recycle per-thread connections so half-dead keep-alive sockets
+    # and stale transports don't accumulate in long sessions
+    _HTTP_MAX_AGE = 30 * 60
+
+    def _authorized_http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """Per-thread AuthorizedHttp so keep-alive sockets are reused safely
+
+        httplib2.Http is not thread-safe; giving each worker thread its
+        own instance keeps connections alive across requests without
+        cross-thread corruption. httplib2 negotiates gzip by default.
+        Instances older than _HTTP_MAX_AGE are rebuilt.
+        """
+        http = getattr(self._thread_local, 'http', None)
+        built_at = getattr(self._thread_local, 'http_built_at', 0)
+        if http is None or time.monotonic() - built_at > self._HTTP_MAX_AGE:
+            http = google_auth_httplib2.AuthorizedHttp(
+                self.creds, http=httplib2.Http(timeout=30)
+            )
+            self._thread_local.http = http
+            self._thread_local.http_built_at = time.monotonic()
+        return http
+
+    def _build_request(self, _http, *args, **kwargs) -> HttpRequest:
+        """requestBuilder hook routing each request to its thread's transport"""
+        return HttpRequest(self._authorized_http(), *args, **kwargs)
+
+    def _needs_refresh(self) -> bool:
+        """True when credentials are invalid or expire within five minutes"""
+        if not self.creds.valid:
+            return True
+        expiry = getattr(self.creds, 'expiry', None)
+        return expiry is not None and expiry - datetime.utcnow() < timedelta(minutes=5)
+
+    async def ensure_fresh(self):
+        """Refresh credentials ahead of expiry so requests never stall mid-flight"""
+        if not self.creds or not self.creds.refresh_token or not self._needs_refresh():
+            return
+
+        async with self._refresh_lock:
+            # Another task may have refreshed while we waited on the lock
+            if not self._needs_refresh():
+                return
+
+            await asyncio.to_thread(self.creds.refresh, Request())
+
+            # Only rewrite the token file when the refresh token rotated -
+            # access tokens are short-lived and not worth a disk write
+            if self.creds.refresh_token != self._saved_refresh_token:
+                token_path = Path.home() / '.docugen' / 'token.json'
+                await asyncio.to_thread(token_path.write_text, self.creds.to_json())
+                self._saved_refresh_token = self.creds.refresh_token
+
+    # Retry transient failures up to this many attempts, backing off
+    # exponentially with jitter and capping the sleep at 32 seconds
+    _MAX_ATTEMPTS = 6
+
+    async def execute(self, request) -> Any:
+        """Run a blocking googleapiclient request without freezing the event loop
+
+        Rate-limit (429) and server (5xx) errors are retried with
+        exponential backoff plus jitter, honoring Retry-After when the
+        server sends one, so quota spikes degrade to waiting instead of
+        cascading failures back to the agent.
+        """
+        await self.ensure_fresh()
+        is_write = getattr(request, 'method', 'GET') != 'GET'
+        for attempt in range(self._MAX_ATTEMPTS):
+            try:
+                if is_write:
+                    await self._write_quota.acquire()
+                async with self._exec_sem:
+                    return await asyncio.to_thread(request.execute)
+            except HttpError as e:
+                status = e.resp.status
+                if status not in (429, 500, 502, 503) or attempt == self._MAX_ATTEMPTS - 1:
+                    raise
+                retry_after = e.resp.get('retry-after')
+                if retry_after and retry_after.isdigit():
+                    delay = min(int(retry_after), 32)
+                else:
+                    delay = min(2 ** attempt + random.random(), 32)
+                logger.warning(f"Sheets API returned {status}; retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    # Metadata reads repeat heavily back to back; a short TTL keeps
+    # them fresh enough while any write through this process drops them
+    _METADATA_TTL = 15
+
+    async def get_metadata(self, spreadsheet_id: str, fields: str) -> Dict[str, Any]:
+        """Fetch spreadsheets.get metadata through a short-TTL cache
+
+        Keyed by (spreadsheet_id, fields) so differently-masked reads
+        don't serve each other partial payloads.
+        """
+        key = (spreadsheet_id, fields)
+        cached = self._fields_cache.get(key)
+        if cached and time.time() - cached[0] < self._METADATA_TTL:
+            return cached[1]
+
+        result = await self.execute(self._ss.get(
+            spreadsheetId=spreadsheet_id,
+            fields=fields
+        ))
+        self._fields_cache[key] = (time.time(), result)
+        return result
+
+    def _invalidate_fields_cache(self, spreadsheet_id: str):
+        for key in [k for k in self._fields_cache if k[0] == spreadsheet_id]:
+            del self._fields_cache[key]
+
+    async def batch_update(self, spreadsheet_id: str, requests: List[dict]) -> Dict[str, Any]:
+        """Issue one spreadsheets.batchUpdate off the event loop
+
+        Single funnel for every structural mutation; runs the blocking
+        googleapiclient call in the shared thread pool and drops cached
+        reads for the spreadsheet afterwards.
+        """
+        result = await self.execute(self._ss.batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={'requests': requests}
+        ))
+        # Structural requests can remap sheet names/ids, so those drop
+        # the sheet caches wholesale; anything else only stales values
+        if any(key in _STRUCTURAL_REQUEST_KEYS for request in requests for key in request):
+            self._invalidate_sheet_cache(spreadsheet_id)
+        else:
+            # Non-structural writes still change what metadata reads
+            # return (rule counts, named ranges, ...), so the short-TTL
+            # fields cache can never survive any batchUpdate
+            self._invalidate_fields_cache(spreadsheet_id)
+            self.invalidate_values_cache(spreadsheet_id)
+        return result
+
+    async def queue_request(self, spreadsheet_id: str, request: dict) -> Optional[Dict[str, Any]]:
+        """Queue a batchUpdate request when batching, or execute it immediately
+
+        Returns the batchUpdate result when executed immediately, or None
+        when the request was queued for a later batch_commit. With
+        DOCUGEN_BATCH_WINDOW_MS set, immediate requests instead wait out
+        a short window so rapid-fire mutations coalesce into one call;
+        each caller still gets a response holding its own reply.
+        """
+        if self._batching:
+            self._pending_requests.setdefault(spreadsheet_id, []).append(request)
+            return None
+
+        if self._batch_window > 0:
+            future = asyncio.get_running_loop().create_future()
+            self._window_queue.setdefault(spreadsheet_id, []).append(request)
+            self._window_futures.setdefault(spreadsheet_id, []).append(future)
+            if spreadsheet_id not in self._window_flush_tasks:
+                self._window_flush_tasks[spreadsheet_id] = asyncio.create_task(
+                    self._flush_window(spreadsheet_id)
+                )
+            return await future
+
+        return await self.batch_update(spreadsheet_id, [request])
+
+    async def _flush_window(self, spreadsheet_id: str):
+        """Flush one coalescing window's worth of queued batchUpdate requests"""
+        await asyncio.sleep(self._batch_window)
+
+        requests = self._window_queue.pop(spreadsheet_id, [])
+        futures = self._window_futures.pop(spreadsheet_id, [])
+        self._window_flush_tasks.pop(spreadsheet_id, None)
+
         try:
-            spreadsheet = self.sheets_service.spreadsheets().get(
-                spreadsheetId=spreadsheet_id
-            ).execute()
-            
-            for sheet in spreadsheet.get('sheets', []):
-                if sheet['properties']['title'] == sheet_name:
-                    return sheet['properties']['sheetId']
+            result = await self.batch_update(spreadsheet_id, requests)
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # Replies come back in queue order, one per request; hand each
+        # caller a response shaped like its own single-request result
+        replies = result.get('replies', [])
+        for i, future in enumerate(futures):
+            if not future.done():
+                future.set_result({
+                    'spreadsheetId': result.get('spreadsheetId', spreadsheet_id),
+                    'replies': replies[i:i + 1]
+                })
+
+    async def queue_requests(self, spreadsheet_id: str, requests: List[dict]) -> Optional[Dict[str, Any]]:
+        """Queue or immediately execute a list of batchUpdate requests"""
+        if not requests:
             return None
-        except HttpError as e:
-            logger.error(f"Error getting sheet ID: {e}")
+        if self._batching:
+            self._pending_requests.setdefault(spreadsheet_id, []).extend(requests)
             return None
 
+        return await self.batch_update(spreadsheet_id, requests)
+
+    async def enqueue_value_update(
+        self,
+        spreadsheet_id: str,
+        range: str,
+        values: List[List[Any]],
+        value_input_option: str
+    ) -> Dict[str, Any]:
+        """Merge rapid-fire value updates into one values.batchUpdate call
+
+        Updates that arrive within a short window for the same spreadsheet
+        are flushed together; each caller still receives its own
+        UpdateValuesResponse.
+        """
+        key = (spreadsheet_id, value_input_option)
+        future = asyncio.get_running_loop().create_future()
+        self._values_queue.setdefault(key, []).append({'range': range, 'values': values})
+        self._values_futures.setdefault(key, []).append(future)
+
+        if key not in self._values_flush_tasks:
+            self._values_flush_tasks[key] = asyncio.create_task(self._flush_values(key))
+
+        return await future
+
+    async def _flush_values(self, key: tuple):
+        """Flush one coalescing window's worth of queued value updates"""
+        await asyncio.sleep(0.05)
+
+        spreadsheet_id, value_input_option = key
+        data = self._values_queue.pop(key, [])
+        futures = self._values_futures.pop(key, [])
+        self._values_flush_tasks.pop(key, None)
+
+        try:
+            result = await self.execute(self._ss_values.batchUpdate(
+                spreadsheetId=spreadsheet_id,
+                body={'valueInputOption': value_input_option, 'data': data},
+                fields='responses'
+            ))
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.invalidate_values_cache(spreadsheet_id)
+
+        # Responses come back in queue order, one per data entry
+        responses = result.get('responses', [])
+        for i, future in enumerate(futures):
+            if not future.done():
+                future.set_result(responses[i] if i < len(responses) else {})
+
+    async def get_values(
+        self,
+        spreadsheet_id: str,
+        range: str,
+        value_render_option: str = 'FORMATTED_VALUE'
+    ) -> List[List[Any]]:
+        """Read a range, serving repeats from a per-spreadsheet cache
+
+        Agents frequently re-read the same range within one task; cached
+        entries make those repeats free. Any write to the spreadsheet
+        through this process drops its cache entries.
+        """
+        key = (range, value_render_option)
+        cached = self._values_cache.get(spreadsheet_id)
+        if cached is not None and key in cached:
+            return cached[key]
+
+        result = await self.execute(self._ss_values.get(
+            spreadsheetId=spreadsheet_id,
+            range=range,
+            valueRenderOption=value_render_option,
+            fields='values'
+        ))
+        values = result.get('values', [])
+        self._values_cache.setdefault(spreadsheet_id, {})[key] = values
+        return values
+
+    def invalidate_values_cache(self, spreadsheet_id: str):
+        """Drop cached range reads after a write to the spreadsheet"""
+        self._values_cache.pop(spreadsheet_id, None)
+
+    async def iter_values(
+        self,
+        spreadsheet_id: str,
+        range: str,
+        value_render_option: str = 'FORMATTED_VALUE',
+        chunk_rows: int = 1000
+    ):
+        """Yield rows from a range in fixed-size windows
+
+        Fetches chunk_rows rows per request so resident memory stays
+        proportional to the window instead of the whole range.
+        """
+        match = _A1_WINDOW_RE.match(range)
+        if not match:
+            # Named range or unrecognized reference - fetch in one shot
+            result = await self.execute(self._ss_values.get(
+                spreadsheetId=spreadsheet_id,
+                range=range,
+                valueRenderOption=value_render_option,
+                fields='values'
+            ))
+            for row in result.get('values', []):
+                yield row
+            return
+
+        sheet, start_col, start_row, end_col, end_row = match.groups()
+        prefix = f"{sheet}!" if sheet else ''
+        end_col = end_col or start_col
+        last_row = int(end_row) if end_row else None
+        row = int(start_row)
+
+        # The API trims trailing empty rows from each window, not just
+        # from the end of the data. Hold the trimmed count back and only
+        # emit those rows as empties once a later window proves the data
+        # continues, so interior empty streaks survive window boundaries
+        # while trailing emptiness is still dropped like a single get.
+        held_empty = 0
+        while True:
+            window_end = row + chunk_rows - 1
+            if last_row is not None:
+                window_end = min(window_end, last_row)
+
+            result = await self.execute(self._ss_values.get(
+                spreadsheetId=spreadsheet_id,
+                range=f"{prefix}{start_col}{row}:{end_col}{window_end}",
+                valueRenderOption=value_render_option,
+                fields='values'
+            ))
+            rows = result.get('values', [])
+            if rows:
+                while held_empty:
+                    yield []
+                    held_empty -= 1
+                for r in rows:
+                    yield r
+                held_empty = window_end - row + 1 - len(rows)
+            else:
+                held_empty += window_end - row + 1
+
+            if last_row is not None:
+                # Bounded range: a short window can just be an empty
+                # streak, so keep reading until the requested end
+                if window_end >= last_row:
+                    return
+            elif len(rows) < window_end - row + 1:
+                # Open-ended range: a short window is the only signal
+                # that the data ended
+                return
+            row = window_end + 1
+
+    async def flush_pending_requests(self) -> Dict[str, List[dict]]:
+        """Send all queued requests, one batchUpdate per spreadsheet
+
+        Flushes for different spreadsheets are independent, so they go
+        out concurrently.
+        """
+        pending = self._pending_requests
+        self._pending_requests = {}
+        if not pending:
+            return {}
+
+        merged_pending = {
+            spreadsheet_id: _merge_dimension_requests(requests)
+            for spreadsheet_id, requests in pending.items()
+        }
+        results = await asyncio.gather(*(
+            self.batch_update(spreadsheet_id, merged)
+            for spreadsheet_id, (merged, _) in merged_pending.items()
+        ))
+
+        replies: Dict[str, List[dict]] = {}
+        for (spreadsheet_id, (_, reply_map)), result in zip(
+                merged_pending.items(), results):
+            self._invalidate_sheet_cache(spreadsheet_id)
+            # Re-expand coalesced dimension requests as empty replies so
+            # positions still line up with the queue order callers saw
+            raw = result.get('replies', [])
+            replies[spreadsheet_id] = [
+                raw[index] if index is not None and index < len(raw) else {}
+                for index in reply_map
+            ]
+        return replies
+
+    def _invalidate_sheet_cache(self, spreadsheet_id: str):
+        """Drop cached sheet IDs and metadata after a structural change"""
+        for key in [k for k in self._sheet_id_cache if k[0] == spreadsheet_id]:
+            del self._sheet_id_cache[key]
+        for key in [k for k in self._sheet_props if k[0] == spreadsheet_id]:
+            del self._sheet_props[key]
+        self._sheet_cache_fetched.pop(spreadsheet_id, None)
+        self._meta_cache.pop(spreadsheet_id, None)
+        self._invalidate_fields_cache(spreadsheet_id)
+        self.invalidate_values_cache(spreadsheet_id)
+
+    # Sheet IDs rarely change, but other clients can restructure the
+    # spreadsheet; expire the map so their edits surface within minutes
+    _SHEET_CACHE_TTL = 300
+
+    async def get_sheet_id_by_name(self, spreadsheet_id: str, sheet_name: str) -> Optional[int]:
+        """Get sheet ID from sheet name, using a per-spreadsheet TTL cache"""
+        fetched = self._sheet_cache_fetched.get(spreadsheet_id)
+        if fetched is not None and time.monotonic() - fetched > self._SHEET_CACHE_TTL:
+            self._invalidate_sheet_cache(spreadsheet_id)
+        sheet_id = self._sheet_id_cache.get((spreadsheet_id, sheet_name))
+        if sheet_id is not None:
+            return sheet_id
+
+        lock = self._sheet_cache_locks.setdefault(spreadsheet_id, asyncio.Lock())
+        async with lock:
+            # Re-check after acquiring the lock - another task may have
+            # refreshed the cache while we were waiting
+            sheet_id = self._sheet_id_cache.get((spreadsheet_id, sheet_name))
+            if sheet_id is not None:
+                return sheet_id
+
+            try:
+                spreadsheet = await self.execute(self._ss.get(
+                    spreadsheetId=spreadsheet_id,
+                    fields='sheets.properties(sheetId,title,index,hidden,'
+                           'gridProperties(frozenRowCount,frozenColumnCount))'
+                ))
+            except HttpError as e:
+                logger.error(f"Error getting sheet ID: {e}")
+                return None
+
+            # Populate the caches for every sheet in one pass
+            for sheet in spreadsheet.get('sheets', []):
+                props = sheet['properties']
+                key = (spreadsheet_id, props['title'])
+                self._sheet_id_cache[key] = props['sheetId']
+                self._sheet_props[key] = props
+            self._sheet_cache_fetched[spreadsheet_id] = time.monotonic()
+
+            return self._sheet_id_cache.get((spreadsheet_id, sheet_name))
+
+    async def get_sheet_props(self, spreadsheet_id: str, sheet_name: str) -> Optional[dict]:
+        """Cached sheet properties (id, index, hidden, frozen counts)"""
+        key = (spreadsheet_id, sheet_name)
+        if key not in self._sheet_props:
+            await self.get_sheet_id_by_name(spreadsheet_id, sheet_name)
+        return self._sheet_props.get(key)
+
+    async def _prefetch(self, spreadsheet_id: str):
+        """Warm the sheet-id and metadata caches for a spreadsheet
+
+        Runs as a background task at startup so the first tool call does
+        not pay the metadata round trip. Failures are logged and ignored;
+        the caches simply stay cold.
+        """
+        try:
+            spreadsheet = await self.execute(self._ss.get(
+                spreadsheetId=spreadsheet_id,
+                fields='properties.title,'
+                       'sheets.properties(sheetId,title,index,hidden,'
+                       'gridProperties(rowCount,columnCount,frozenRowCount,frozenColumnCount)),'
+                       'namedRanges.name'
+            ))
+        except HttpError as e:
+            logger.warning(f"Metadata prefetch failed for {spreadsheet_id}: {e}")
+            return
+
+        for sheet in spreadsheet.get('sheets', []):
+            props = sheet['properties']
+            key = (spreadsheet_id, props['title'])
+            self._sheet_id_cache[key] = props['sheetId']
+            self._sheet_props[key] = props
+        self._sheet_cache_fetched[spreadsheet_id] = time.monotonic()
+
+        metadata = {
+            "title": spreadsheet['properties']['title'],
+            "sheets": [
+                {
+                    "name": sheet['properties']['title'],
+                    "id": sheet['properties']['sheetId'],
+                    "rows": sheet['properties'].get('gridProperties', {}).get('rowCount', 0),
+                    "columns": sheet['properties'].get('gridProperties', {}).get('columnCount', 0)
+                }
+                for sheet in spreadsheet.get('sheets', [])
+            ],
+            "namedRanges": [
+                nr.get('name', '') for nr in spreadsheet.get('namedRanges', [])
+            ]
+        }
+        self._meta_cache[spreadsheet_id] = (time.time(), metadata)
+
 # ============================================================================
 # APPLICATION CONTEXT
 # ============================================================================
@@ -133,15 +1123,51 @@ class AppContext:
 @asynccontextmanager
 async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     """Manage application lifecycle"""
+    # Bound the thread pool shared by all to_thread-wrapped API calls
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=32))
+
     # Initialize Google Sheets client
+    global _sheets_client
     sheets_client = GoogleSheetsClient()
     await sheets_client.authenticate()
+    _sheets_client = sheets_client
+
+    # If the deployment pins one spreadsheet, make it current so tools
+    # can omit spreadsheet_id, and bootstrap its sheet properties once
+    current_id = os.getenv('DOCUGEN_SPREADSHEET_ID')
+    if current_id:
+        sheets_client.current_spreadsheet_id = current_id
+
+    # Warm the caches in the background so the first tool call is fast
+    prefetch_id = current_id or os.getenv('DOCUGEN_PREFETCH_SHEET_ID')
+    if prefetch_id:
+        asyncio.create_task(sheets_client._prefetch(prefetch_id))
     
     try:
         yield AppContext(sheets_client=sheets_client)
     finally:
-        # Cleanup if needed
-        pass
+        _sheets_client = None
+
+# Bound once in app_lifespan; lets tools skip the four-level context walk
+_sheets_client: Optional[GoogleSheetsClient] = None
+
+def _client(ctx: Context) -> GoogleSheetsClient:
+    """Resolve the sheets client without re-walking the request context"""
+    return _sheets_client or ctx.request_context.lifespan_context.sheets_client
+
+def _require_spreadsheet(client: GoogleSheetsClient, spreadsheet_id: Optional[str]) -> str:
+    """Default to the current spreadsheet, failing fast when none is set"""
+    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
+    if not spreadsheet_id:
+        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    return spreadsheet_id
+
+async def _resolve_sheet(client: GoogleSheetsClient, spreadsheet_id: str, sheet_name: str) -> int:
+    """Resolve a sheet name to its ID, raising when the sheet doesn't exist"""
+    sheet_id = await client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
+    if sheet_id is None:
+        raise ValueError(f"Sheet '{sheet_name}' not found")
+    return sheet_id
 
 # ============================================================================
 # CREATE MCP SERVER
@@ -184,7 +1210,7 @@ async def spreadsheet_create(
     Returns:
         Information about the created spreadsheet
     """
-    client = ctx.request_context.lifespan_context.sheets_client
+    client = _client(ctx)
     
     spreadsheet_body = {
         'properties': {'title': title},
@@ -194,15 +1220,22 @@ async def spreadsheet_create(
         ]
     }
     
-    result = client.sheets_service.spreadsheets().create(
+    result = await client.execute(client._ss.create(
         body=spreadsheet_body,
         fields='spreadsheetId,spreadsheetUrl,sheets'
-    ).execute()
+    ))
     
     # Set as current spreadsheet
     client.current_spreadsheet_id = result['spreadsheetId']
-    
-    return SpreadsheetInfo(
+
+    # Seed the sheet ID cache from the creation response
+    client._invalidate_sheet_cache(result['spreadsheetId'])
+    for sheet in result.get('sheets', []):
+        props = sheet['properties']
+        client._sheet_id_cache[(result['spreadsheetId'], props['title'])] = props['sheetId']
+
+    # model_construct skips validation - every field was built right here
+    return SpreadsheetInfo.model_construct(
         spreadsheet_id=result['spreadsheetId'],
         title=title,
         url=result.get('spreadsheetUrl', ''),
@@ -223,18 +1256,25 @@ async def spreadsheet_get_metadata(
     Returns:
         Spreadsheet metadata
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    sheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not sheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    spreadsheet = client.sheets_service.spreadsheets().get(
+    client = _client(ctx)
+    sheet_id = _require_spreadsheet(client, spreadsheet_id)
+
+    # Agents re-inspect the same spreadsheet constantly; serve recent
+    # metadata from cache and invalidate on structural mutations
+    cached = client._meta_cache.get(sheet_id)
+    if cached and time.time() - cached[0] < 10:
+        client._meta_cache_hits += 1
+        return cached[1]
+    client._meta_cache_misses += 1
+
+    spreadsheet = await client.execute(client._ss.get(
         spreadsheetId=sheet_id,
-        fields='properties,sheets,namedRanges'
-    ).execute()
+        fields='properties.title,'
+               'sheets.properties(sheetId,title,gridProperties(rowCount,columnCount)),'
+               'namedRanges.name'
+    ))
     
-    return {
+    metadata = {
         "title": spreadsheet['properties']['title'],
         "sheets": [
             {
@@ -251,6 +1291,9 @@ async def spreadsheet_get_metadata(
         ]
     }
 
+    client._meta_cache[sheet_id] = (time.time(), metadata)
+    return metadata
+
 # ============================================================================
 # VALUES OPERATIONS
 # ============================================================================
@@ -273,19 +1316,46 @@ async def values_get(
     Returns:
         2D array of cell values
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    sheet_id = spreadsheet_id or client.current_spreadsheet_id
+    client = _client(ctx)
+    sheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    if not sheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    return await client.get_values(sheet_id, range, value_render_option)
+
+@mcp.tool()
+async def values_iter(
+    ctx: Context,
+    range: str,
+    spreadsheet_id: Optional[str] = None,
+    value_render_option: str = "FORMATTED_VALUE",
+    offset: int = 0,
+    limit: int = 1000
+) -> List[List[Any]]:
+    """
+    Read a window of rows from a large range without fetching it all
     
-    result = client.sheets_service.spreadsheets().values().get(
-        spreadsheetId=sheet_id,
-        range=range,
-        valueRenderOption=value_render_option
-    ).execute()
+    Args:
+        range: A1 notation range (e.g., 'Sheet1!A1:B100000')
+        spreadsheet_id: Spreadsheet ID (uses current if not provided)
+        value_render_option: How to render values (FORMATTED_VALUE, UNFORMATTED_VALUE, FORMULA)
+        offset: Number of rows to skip from the start of the range
+        limit: Maximum number of rows to return
     
-    return result.get('values', [])
+    Returns:
+        2D array with at most `limit` rows
+    """
+    client = _client(ctx)
+    sheet_id = _require_spreadsheet(client, spreadsheet_id)
+    
+    rows: List[List[Any]] = []
+    index = 0
+    async for row in client.iter_values(sheet_id, range, value_render_option):
+        if index >= offset:
+            rows.append(row)
+            if len(rows) >= limit:
+                break
+        index += 1
+    
+    return rows
 
 @mcp.tool()
 async def values_update(
@@ -307,21 +1377,30 @@ async def values_update(
     Returns:
         Update result with number of cells updated
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    sheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not sheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    body = {'values': values}
-    
-    result = client.sheets_service.spreadsheets().values().update(
-        spreadsheetId=sheet_id,
-        range=range,
-        valueInputOption=value_input_option,
-        body=body
-    ).execute()
-    
+    client = _client(ctx)
+    sheet_id = _require_spreadsheet(client, spreadsheet_id)
+
+    # Oversized writes blow past request-size limits and spike JSON cost;
+    # split them into anchored row chunks. The update queue coalesces the
+    # chunks into a single values.batchUpdate call.
+    width = max((len(row) for row in values), default=0)
+    if len(values) * width > _VALUES_CELL_LIMIT:
+        pending = []
+        offset = 0
+        for chunk in _chunked(values, _VALUES_CHUNK_ROWS):
+            pending.append(client.enqueue_value_update(
+                sheet_id, _shift_a1_rows(range, offset), chunk, value_input_option))
+            offset += len(chunk)
+        results = await asyncio.gather(*pending)
+        return {
+            "updatedCells": sum(r.get('updatedCells', 0) for r in results),
+            "updatedRows": sum(r.get('updatedRows', 0) for r in results),
+            "updatedColumns": max((r.get('updatedColumns', 0) for r in results), default=0),
+            "updatedRange": range
+        }
+
+    result = await client.enqueue_value_update(sheet_id, range, values, value_input_option)
+
     return {
         "updatedCells": result.get('updatedCells', 0),
         "updatedRows": result.get('updatedRows', 0),
@@ -349,22 +1428,21 @@ async def values_append(
     Returns:
         Append result with location of appended data
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    sheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not sheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    sheet_id = _require_spreadsheet(client, spreadsheet_id)
     
     body = {'values': values}
     
-    result = client.sheets_service.spreadsheets().values().append(
+    result = await client.execute(client._ss_values.append(
         spreadsheetId=sheet_id,
         range=range,
         valueInputOption="USER_ENTERED",
         insertDataOption=insert_data_option,
         body=body
-    ).execute()
+    ))
     
+    client.invalidate_values_cache(sheet_id)
+
     updates = result.get('updates', {})
     return {
         "updatedCells": updates.get('updatedCells', 0),
@@ -388,18 +1466,17 @@ async def values_clear(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    sheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not sheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    sheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    result = client.sheets_service.spreadsheets().values().clear(
+    result = await client.execute(client._ss_values.clear(
         spreadsheetId=sheet_id,
         range=range,
         body={}
-    ).execute()
+    ))
     
+    client.invalidate_values_cache(sheet_id)
+
     return f"Cleared range: {result.get('clearedRange', range)}"
 
 @mcp.tool()
@@ -418,16 +1495,14 @@ async def values_batch_get(
     Returns:
         Dictionary mapping ranges to their values
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    sheet_id = spreadsheet_id or client.current_spreadsheet_id
+    client = _client(ctx)
+    sheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    if not sheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    result = client.sheets_service.spreadsheets().values().batchGet(
+    result = await client.execute(client._ss_values.batchGet(
         spreadsheetId=sheet_id,
-        ranges=ranges
-    ).execute()
+        ranges=ranges,
+        fields='valueRanges(range,values)'
+    ))
     
     return {
         vr.get('range', ''): vr.get('values', [])
@@ -450,11 +1525,8 @@ async def values_batch_update(
     Returns:
         Summary of updates
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    sheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not sheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    sheet_id = _require_spreadsheet(client, spreadsheet_id)
     
     body = {
         'valueInputOption': 'USER_ENTERED',
@@ -467,11 +1539,13 @@ async def values_batch_update(
         ]
     }
     
-    result = client.sheets_service.spreadsheets().values().batchUpdate(
+    result = await client.execute(client._ss_values.batchUpdate(
         spreadsheetId=sheet_id,
         body=body
-    ).execute()
+    ))
     
+    client.invalidate_values_cache(sheet_id)
+
     return {
         "totalUpdatedCells": result.get('totalUpdatedCells', 0),
         "totalUpdatedRows": result.get('totalUpdatedRows', 0),
@@ -479,6 +1553,53 @@ async def values_batch_update(
         "totalUpdatedSheets": result.get('totalUpdatedSheets', 0)
     }
 
+# ============================================================================
+# BATCH OPERATIONS
+# ============================================================================
+
+@mcp.tool()
+async def batch_start(ctx: Context) -> str:
+    """
+    Start batch mode - queue structural requests instead of sending them
+
+    While batch mode is active, tools that use batchUpdate (sheet_add,
+    sheet_delete, format_cells, chart_create, rows_insert, etc.) queue
+    their requests instead of issuing one HTTP call each. Call
+    batch_commit to send everything as a single batchUpdate.
+
+    Returns:
+        Confirmation message
+    """
+    client = _client(ctx)
+    client._batching = True
+    return "Batch mode started - requests will be queued until batch_commit"
+
+@mcp.tool()
+async def batch_commit(ctx: Context) -> Dict[str, Any]:
+    """
+    Flush all queued requests as one batchUpdate per spreadsheet
+
+    Returns:
+        Queued request counts and the replies list per spreadsheet, in
+        queue order, so callers can match addSheet/addChart IDs by
+        position. Contiguous dimension requests are coalesced before
+        sending, but their slots stay in the replies list as empty
+        dicts so positions are stable.
+    """
+    client = _client(ctx)
+    client._batching = False
+
+    counts = {sid: len(reqs) for sid, reqs in client._pending_requests.items()}
+
+    # Drain the structural queue and any open value-update windows in
+    # parallel - they hit different endpoints and don't depend on each
+    # other's results
+    value_flushes = list(client._values_flush_tasks.values())
+    replies, *_ = await asyncio.gather(
+        client.flush_pending_requests(), *value_flushes)
+
+    return {"committed": counts, "replies": replies}
+
 # ============================================================================
 # SHEET OPERATIONS
 # ============================================================================
@@ -503,11 +1624,8 @@ async def sheet_add(
     Returns:
         Information about the created sheet
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    sheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not sheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    sheet_id = _require_spreadsheet(client, spreadsheet_id)
     
     request = {
         'addSheet': {
@@ -521,24 +1639,22 @@ async def sheet_add(
         }
     }
     
-    body = {'requests': [request]}
-    
-    result = client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=sheet_id,
-        body=body
-    ).execute()
-    
-    replies = result.get('replies', [])
-    if replies and 'addSheet' in replies[0]:
-        new_sheet = replies[0]['addSheet']['properties']
-        return {
-            "sheetId": new_sheet['sheetId'],
-            "title": new_sheet['title'],
-            "rows": rows,
-            "columns": columns
-        }
-    
-    return {"title": title, "rows": rows, "columns": columns}
+    result = await client.queue_request(sheet_id, request)
+
+    # The reply is guaranteed on the immediate path - index it directly
+    # and let the except cover the queued (result is None) case
+    try:
+        new_sheet = result['replies'][0]['addSheet']['properties']
+    except (TypeError, KeyError, IndexError):
+        return {"title": title, "rows": rows, "columns": columns}
+
+    client._sheet_id_cache[(sheet_id, new_sheet['title'])] = new_sheet['sheetId']
+    return {
+        "sheetId": new_sheet['sheetId'],
+        "title": new_sheet['title'],
+        "rows": rows,
+        "columns": columns
+    }
 
 @mcp.tool()
 async def sheet_delete(
@@ -556,16 +1672,11 @@ async def sheet_delete(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
     # Get sheet ID
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
     request = {
         'deleteSheet': {
@@ -573,13 +1684,9 @@ async def sheet_delete(
         }
     }
     
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
-    
+    await client.queue_request(spreadsheet_id, request)
+
+    client._invalidate_sheet_cache(spreadsheet_id)
     return f"Deleted sheet: {sheet_name}"
 
 @mcp.tool()
@@ -600,14 +1707,11 @@ async def sheet_duplicate(
     Returns:
         Information about the duplicated sheet
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
     # Get source sheet ID
-    source_sheet_id = client.get_sheet_id_by_name(spreadsheet_id, source_sheet_name)
+    source_sheet_id = await client.get_sheet_id_by_name(spreadsheet_id, source_sheet_name)
     if source_sheet_id is None:
         raise ValueError(f"Sheet '{source_sheet_name}' not found")
     
@@ -618,22 +1722,18 @@ async def sheet_duplicate(
         }
     }
     
-    body = {'requests': [request]}
-    
-    result = client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
-    
-    replies = result.get('replies', [])
-    if replies and 'duplicateSheet' in replies[0]:
-        new_sheet = replies[0]['duplicateSheet']['properties']
-        return {
-            "sheetId": new_sheet['sheetId'],
-            "title": new_sheet['title']
-        }
-    
-    return {"title": new_sheet_name}
+    result = await client.queue_request(spreadsheet_id, request)
+
+    try:
+        new_sheet = result['replies'][0]['duplicateSheet']['properties']
+    except (TypeError, KeyError, IndexError):
+        return {"title": new_sheet_name}
+
+    client._sheet_id_cache[(spreadsheet_id, new_sheet['title'])] = new_sheet['sheetId']
+    return {
+        "sheetId": new_sheet['sheetId'],
+        "title": new_sheet['title']
+    }
 
 # ============================================================================
 # FORMATTING OPERATIONS
@@ -669,18 +1769,12 @@ async def format_cells(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
     # Parse range to get sheet name
-    sheet_name = range.split('!')[0] if '!' in range else 'Sheet1'
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    sheet_name = _split_a1(range)[0]
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
     # Build format request
     cell_format = {}
@@ -697,23 +1791,12 @@ async def format_cells(
         cell_format['textFormat'] = text_format
     
     if bg_color:
-        # Convert hex to RGB
-        bg_color = bg_color.lstrip('#')
-        cell_format['backgroundColor'] = {
-            'red': int(bg_color[0:2], 16) / 255,
-            'green': int(bg_color[2:4], 16) / 255,
-            'blue': int(bg_color[4:6], 16) / 255
-        }
+        cell_format['backgroundColor'] = _hex_rgb(bg_color)
     
     if text_color:
-        text_color = text_color.lstrip('#')
         if 'textFormat' not in cell_format:
             cell_format['textFormat'] = {}
-        cell_format['textFormat']['foregroundColor'] = {
-            'red': int(text_color[0:2], 16) / 255,
-            'green': int(text_color[2:4], 16) / 255,
-            'blue': int(text_color[4:6], 16) / 255
-        }
+        cell_format['textFormat']['foregroundColor'] = _hex_rgb(text_color)
     
     if h_align:
         cell_format['horizontalAlignment'] = h_align
@@ -737,13 +1820,8 @@ async def format_cells(
         }
     }
     
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
-    
+    await client.queue_request(spreadsheet_id, request)
+
     return f"Applied formatting to {range}"
 
 # ============================================================================
@@ -766,18 +1844,12 @@ async def chart_create(
     Returns:
         Information about the created chart
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
     # Get sheet name from range
-    sheet_name = chart_spec.data_range.split('!')[0] if '!' in chart_spec.data_range else 'Sheet1'
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    sheet_name = _split_a1(chart_spec.data_range)[0]
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
     # Build chart specification
     chart_request = {
@@ -810,23 +1882,18 @@ async def chart_create(
         }
     }
     
-    body = {'requests': [chart_request]}
-    
-    result = client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
-    
-    replies = result.get('replies', [])
-    if replies and 'addChart' in replies[0]:
-        chart = replies[0]['addChart']['chart']
-        return {
-            "chartId": chart.get('chartId'),
-            "title": chart_spec.title,
-            "type": chart_spec.chart_type
-        }
-    
-    return {"title": chart_spec.title, "type": chart_spec.chart_type}
+    result = await client.queue_request(spreadsheet_id, chart_request)
+
+    try:
+        chart = result['replies'][0]['addChart']['chart']
+    except (TypeError, KeyError, IndexError):
+        return {"title": chart_spec.title, "type": chart_spec.chart_type}
+
+    return {
+        "chartId": chart.get('chartId'),
+        "title": chart_spec.title,
+        "type": chart_spec.chart_type
+    }
 
 # ============================================================================
 # DIMENSION OPERATIONS
@@ -852,15 +1919,10 @@ async def rows_insert(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
     request = {
         'insertDimension': {
@@ -874,13 +1936,9 @@ async def rows_insert(
         }
     }
     
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
-    
+    await client.queue_request(spreadsheet_id, request)
+    client._meta_cache.pop(spreadsheet_id, None)
+
     return f"Inserted {num_rows} row(s) at position {start_index + 1} in '{sheet_name}'"
 
 @mcp.tool()
@@ -903,15 +1961,10 @@ async def columns_insert(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
     request = {
         'insertDimension': {
@@ -925,15 +1978,9 @@ async def columns_insert(
         }
     }
     
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
-    
-    # Convert index to column letter
-    column_letter = chr(65 + start_index)
+    await client.queue_request(spreadsheet_id, request)
+
+    column_letter = _col_letter(start_index)
     return f"Inserted {num_columns} column(s) at position {column_letter} in '{sheet_name}'"
 
 # ============================================================================
@@ -960,39 +2007,21 @@ async def filter_apply(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
-    # Parse range to get dimensions
-    # For simplicity, using default range
     request = {
         'setBasicFilter': {
             'filter': {
-                'range': {
-                    'sheetId': sheet_id,
-                    'startRowIndex': 0,
-                    'endRowIndex': 1000,
-                    'startColumnIndex': 0,
-                    'endColumnIndex': 26
-                },
+                'range': _grid_range(sheet_id, filter_range),
                 'criteria': {}
             }
         }
     }
     
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Applied filter to {filter_range} in '{sheet_name}'"
 
@@ -1012,15 +2041,10 @@ async def filter_clear(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
     request = {
         'clearBasicFilter': {
@@ -1028,12 +2052,7 @@ async def filter_clear(
         }
     }
     
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Cleared filters from '{sheet_name}'"
 
@@ -1065,15 +2084,12 @@ async def pivot_table_create(
     Returns:
         Information about created pivot table
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    source_sheet = source_range.split('!')[0] if '!' in source_range else 'Sheet1'
-    source_sheet_id = client.get_sheet_id_by_name(spreadsheet_id, source_sheet)
-    target_sheet_id = client.get_sheet_id_by_name(spreadsheet_id, target_sheet)
+    source_sheet = _split_a1(source_range)[0]
+    source_sheet_id = await client.get_sheet_id_by_name(spreadsheet_id, source_sheet)
+    target_sheet_id = await client.get_sheet_id_by_name(spreadsheet_id, target_sheet)
     
     if source_sheet_id is None or target_sheet_id is None:
         raise ValueError("Sheet not found")
@@ -1111,12 +2127,7 @@ async def pivot_table_create(
         }
     }
     
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return {
         "source": source_range,
@@ -1152,51 +2163,16 @@ async def conditional_format_add(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_name = range.split('!')[0] if '!' in range else 'Sheet1'
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
-    
-    # Build conditional format rule
-    rule = {
-        'ranges': [
-            {
-                'sheetId': sheet_id,
-                'startRowIndex': 0,
-                'endRowIndex': 100,
-                'startColumnIndex': 0,
-                'endColumnIndex': 26
-            }
-        ],
-        'booleanRule': {
-            'condition': {
-                'type': rule_type,
-                'values': [{'userEnteredValue': str(v)} for v in condition.get('values', [])]
-            },
-            'format': format_options
-        }
-    }
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    request = {
-        'addConditionalFormatRule': {
-            'rule': rule,
-            'index': 0
-        }
-    }
+    sheet_name = _split_a1(range)[0]
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
-    body = {'requests': [request]}
+    request = _build_conditional_format_add_request(
+        sheet_id, range, rule_type, condition, format_options)
     
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Added conditional formatting to {range}"
 
@@ -1216,40 +2192,34 @@ async def conditional_format_clear(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    # Get all conditional format rules
-    spreadsheet = client.sheets_service.spreadsheets().get(
-        spreadsheetId=spreadsheet_id,
-        fields='sheets.conditionalFormats'
-    ).execute()
-    
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    # Find rules for this sheet
-    requests = []
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
+
+    # Only this sheet's rule count is needed - keep the payload narrow
+    spreadsheet = await client.get_metadata(
+        spreadsheet_id, 'sheets(properties.sheetId,conditionalFormats.ranges)')
+
+    rule_count = 0
     for sheet in spreadsheet.get('sheets', []):
         if sheet['properties']['sheetId'] == sheet_id:
-            for rule in sheet.get('conditionalFormats', []):
-                requests.append({
-                    'deleteConditionalFormatRule': {
-                        'sheetId': sheet_id,
-                        'index': 0
-                    }
-                })
-    
-    if requests:
-        body = {'requests': requests}
-        client.sheets_service.spreadsheets().batchUpdate(
-            spreadsheetId=spreadsheet_id,
-            body=body
-        ).execute()
+            rule_count = len(sheet.get('conditionalFormats', []))
+            break
+
+    # Delete from the highest index down so earlier deletes in the same
+    # batch don't shift the indices of later ones
+    requests = [
+        {
+            'deleteConditionalFormatRule': {
+                'sheetId': sheet_id,
+                'index': index
+            }
+        }
+        for index in range(rule_count - 1, -1, -1)
+    ]
+
+    await client.queue_requests(spreadsheet_id, requests)
     
     return f"Cleared conditional formatting from '{sheet_name}'"
 
@@ -1281,54 +2251,16 @@ async def validation_add(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_name = range.split('!')[0] if '!' in range else 'Sheet1'
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
-    
-    # Build validation rule
-    validation = {
-        'condition': {
-            'type': validation_type
-        },
-        'showCustomUi': True,
-        'strict': True
-    }
-    
-    if validation_type == 'ONE_OF_LIST' and values:
-        validation['condition']['values'] = [{'userEnteredValue': v} for v in values]
-    elif validation_type == 'NUMBER_BETWEEN':
-        validation['condition']['values'] = [
-            {'userEnteredValue': str(min_value)},
-            {'userEnteredValue': str(max_value)}
-        ]
-    
-    request = {
-        'setDataValidation': {
-            'range': {
-                'sheetId': sheet_id,
-                'startRowIndex': 0,
-                'endRowIndex': 100,
-                'startColumnIndex': 0,
-                'endColumnIndex': 26
-            },
-            'rule': validation
-        }
-    }
+    sheet_name = _split_a1(range)[0]
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
-    body = {'requests': [request]}
+    request = _build_validation_add_request(
+        sheet_id, range, validation_type, values, min_value, max_value)
     
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Added data validation to {range}"
 
@@ -1348,36 +2280,19 @@ async def validation_clear(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_name = range.split('!')[0] if '!' in range else 'Sheet1'
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    sheet_name = _split_a1(range)[0]
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
     request = {
         'setDataValidation': {
-            'range': {
-                'sheetId': sheet_id,
-                'startRowIndex': 0,
-                'endRowIndex': 100,
-                'startColumnIndex': 0,
-                'endColumnIndex': 26
-            }
+            'range': _grid_range(sheet_id, range)
         }
     }
     
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Cleared data validation from {range}"
 
@@ -1398,49 +2313,30 @@ async def named_range_add(
     Args:
         name: Name for the range
         range: Range in A1 notation
-        spreadsheet_id: Spreadsheet ID (uses current if not provided)
-    
-    Returns:
-        Named range information
-    """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_name = range.split('!')[0] if '!' in range else 'Sheet1'
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
+        spreadsheet_id: Spreadsheet ID (uses current if not provided)
     
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    Returns:
+        Named range information
+    """
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    request = {
-        'addNamedRange': {
-            'namedRange': {
-                'name': name,
-                'range': {
-                    'sheetId': sheet_id,
-                    'startRowIndex': 0,
-                    'endRowIndex': 100,
-                    'startColumnIndex': 0,
-                    'endColumnIndex': 26
-                }
-            }
-        }
-    }
+    sheet_name = _split_a1(range)[0]
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
-    body = {'requests': [request]}
+    request = _build_named_range_add_request(sheet_id, range, name)
     
-    result = client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    result = await client.queue_request(spreadsheet_id, request)
     
+    try:
+        named_range_id = result['replies'][0]['addNamedRange']['namedRange']['namedRangeId']
+    except (TypeError, KeyError, IndexError):
+        named_range_id = ''
+
     return {
         "name": name,
         "range": range,
-        "namedRangeId": result.get('replies', [{}])[0].get('addNamedRange', {}).get('namedRange', {}).get('namedRangeId', '')
+        "namedRangeId": named_range_id
     }
 
 @mcp.tool()
@@ -1459,17 +2355,11 @@ async def named_range_delete(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
     # Get named ranges
-    spreadsheet = client.sheets_service.spreadsheets().get(
-        spreadsheetId=spreadsheet_id,
-        fields='namedRanges'
-    ).execute()
+    spreadsheet = await client.get_metadata(spreadsheet_id, 'namedRanges(name,namedRangeId)')
     
     # Find the named range
     named_range_id = None
@@ -1487,12 +2377,7 @@ async def named_range_delete(
         }
     }
     
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Deleted named range: {name}"
 
@@ -1520,26 +2405,14 @@ async def protection_add(
     Returns:
         Protection information
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    sheet_name = range.split('!')[0] if '!' in range else 'Sheet1'
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    sheet_name = _split_a1(range)[0]
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
     protected_range = {
-        'range': {
-            'sheetId': sheet_id,
-            'startRowIndex': 0,
-            'endRowIndex': 100,
-            'startColumnIndex': 0,
-            'endColumnIndex': 26
-        },
+        'range': _grid_range(sheet_id, range),
         'description': description,
         'warningOnly': len(editors) == 0
     }
@@ -1553,17 +2426,17 @@ async def protection_add(
         }
     }
     
-    body = {'requests': [request]}
-    
-    result = client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    result = await client.queue_request(spreadsheet_id, request)
     
+    try:
+        protected_range_id = result['replies'][0]['addProtectedRange']['protectedRange']['protectedRangeId']
+    except (TypeError, KeyError, IndexError):
+        protected_range_id = 0
+
     return {
         "range": range,
         "description": description,
-        "protectedRangeId": result.get('replies', [{}])[0].get('addProtectedRange', {}).get('protectedRange', {}).get('protectedRangeId', 0)
+        "protectedRangeId": protected_range_id
     }
 
 @mcp.tool()
@@ -1582,11 +2455,8 @@ async def protection_remove(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
     request = {
         'deleteProtectedRange': {
@@ -1594,12 +2464,7 @@ async def protection_remove(
         }
     }
     
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Removed protection with ID: {protection_id}"
 
@@ -1625,37 +2490,15 @@ async def cells_merge(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_name = range.split('!')[0] if '!' in range else 'Sheet1'
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    request = {
-        'mergeCells': {
-            'range': {
-                'sheetId': sheet_id,
-                'startRowIndex': 0,
-                'endRowIndex': 10,
-                'startColumnIndex': 0,
-                'endColumnIndex': 5
-            },
-            'mergeType': merge_type
-        }
-    }
+    sheet_name = _split_a1(range)[0]
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
-    body = {'requests': [request]}
+    request = _build_cells_merge_request(sheet_id, range, merge_type)
     
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Merged cells in {range} using {merge_type}"
 
@@ -1675,36 +2518,15 @@ async def cells_unmerge(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_name = range.split('!')[0] if '!' in range else 'Sheet1'
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    request = {
-        'unmergeCells': {
-            'range': {
-                'sheetId': sheet_id,
-                'startRowIndex': 0,
-                'endRowIndex': 10,
-                'startColumnIndex': 0,
-                'endColumnIndex': 5
-            }
-        }
-    }
+    sheet_name = _split_a1(range)[0]
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
-    body = {'requests': [request]}
+    request = _build_cells_unmerge_request(sheet_id, range)
     
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Unmerged cells in {range}"
 
@@ -1734,54 +2556,16 @@ async def borders_update(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_name = range.split('!')[0] if '!' in range else 'Sheet1'
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
-    
-    # Convert hex color to RGB
-    color = border_color.lstrip('#')
-    border = {
-        'style': border_style,
-        'width': border_width,
-        'color': {
-            'red': int(color[0:2], 16) / 255,
-            'green': int(color[2:4], 16) / 255,
-            'blue': int(color[4:6], 16) / 255
-        }
-    }
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    request = {
-        'updateBorders': {
-            'range': {
-                'sheetId': sheet_id,
-                'startRowIndex': 0,
-                'endRowIndex': 10,
-                'startColumnIndex': 0,
-                'endColumnIndex': 5
-            },
-            'top': border,
-            'bottom': border,
-            'left': border,
-            'right': border,
-            'innerHorizontal': border,
-            'innerVertical': border
-        }
-    }
+    sheet_name = _split_a1(range)[0]
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
-    body = {'requests': [request]}
+    request = _build_borders_update_request(
+        sheet_id, range, border_style, border_width, border_color)
     
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Updated borders for {range}"
 
@@ -1797,52 +2581,64 @@ async def find_replace(
     sheet_name: Optional[str] = None,
     match_case: bool = False,
     match_entire_cell: bool = False,
+    local: bool = False,
+    use_regex: bool = False,
     spreadsheet_id: Optional[str] = None
 ) -> Dict[str, int]:
     """
     Find and replace text in spreadsheet
-    
+
     Args:
         find: Text to find
         replace: Text to replace with
         sheet_name: Specific sheet (or all sheets if None)
         match_case: Case sensitive search
         match_entire_cell: Match entire cell contents
+        local: Replace client-side with one batched get and one batched
+            update instead of a server-side findReplace; spares the
+            write quota when only a few cells change
+        use_regex: Treat find as a regular expression (server-side only)
         spreadsheet_id: Spreadsheet ID (uses current if not provided)
-    
+
     Returns:
         Number of replacements made
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
+
+    # A no-op replacement would still cost a full write - skip the HTTP
+    # call entirely
+    if not find or (find == replace and not use_regex):
+        return {"occurrencesChanged": 0, "find": find, "replace": replace}
+
+    if local:
+        return await _find_replace_local(
+            client, spreadsheet_id, find, replace,
+            sheet_name, match_case, match_entire_cell
+        )
+
     request = {
         'findReplace': {
             'find': find,
             'replacement': replace,
             'matchCase': match_case,
             'matchEntireCell': match_entire_cell,
-            'searchByRegex': False,
+            'searchByRegex': use_regex,
             'includeFormulas': False
         }
     }
     
     if sheet_name:
-        sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
+        sheet_id = await client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
         if sheet_id is not None:
             request['findReplace']['sheetId'] = sheet_id
     
-    body = {'requests': [request]}
-    
-    result = client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    result = await client.queue_request(spreadsheet_id, request)
     
-    occurrences = result.get('replies', [{}])[0].get('findReplace', {}).get('occurrencesChanged', 0)
+    try:
+        occurrences = result['replies'][0]['findReplace']['occurrencesChanged']
+    except (TypeError, KeyError, IndexError):
+        occurrences = 0
     
     return {
         "occurrencesChanged": occurrences,
@@ -1850,6 +2646,103 @@ async def find_replace(
         "replace": replace
     }
 
+def _cell_run_entry(prefix: str, row: int, col: int, values: List[Any]) -> dict:
+    """ValueRange for one horizontal run of cells (0-based row/col)"""
+    row_num = row + 1
+    end_col = _col_letter(col + len(values) - 1)
+    return {
+        'range': f"{prefix}{_col_letter(col)}{row_num}:{end_col}{row_num}",
+        'values': [values]
+    }
+
+async def _find_replace_local(
+    client: GoogleSheetsClient,
+    spreadsheet_id: str,
+    find: str,
+    replace: str,
+    sheet_name: Optional[str],
+    match_case: bool,
+    match_entire_cell: bool
+) -> Dict[str, int]:
+    """Replace text with one batched read and one batched write
+
+    Downloads the target sheets via values.batchGet rendered as
+    FORMULA - so formulas arrive as '=...' source text and numbers
+    stay numbers instead of display strings - substitutes in Python
+    across plain text cells only, and writes back just the runs of
+    cells that actually changed. Two requests total regardless of
+    match count, none if nothing matched.
+    """
+    if sheet_name:
+        ranges = [sheet_name]
+    else:
+        spreadsheet = await client.execute(client._ss.get(
+            spreadsheetId=spreadsheet_id,
+            fields='sheets.properties.title'
+        ))
+        ranges = [s['properties']['title'] for s in spreadsheet.get('sheets', [])]
+
+    result = await client.execute(client._ss_values.batchGet(
+        spreadsheetId=spreadsheet_id,
+        ranges=ranges,
+        valueRenderOption='FORMULA',
+        fields='valueRanges(range,values)'
+    ))
+
+    pattern = re.compile(re.escape(find), 0 if match_case else re.IGNORECASE)
+    occurrences = 0
+    changed_data = []
+
+    for value_range in result.get('valueRanges', []):
+        sheet, cell_part = _split_a1(value_range['range'])
+        origin = cell_part.partition(':')[0]
+        row0, col0 = _parse_cell(origin) if origin else (0, 0)
+        prefix = "'{}'!".format(sheet.replace("'", "''"))
+
+        for r, row in enumerate(value_range.get('values', [])):
+            # Collect contiguous runs of changed cells so each run
+            # becomes one minimal sub-range in the write-back
+            run_start = None
+            run_values: List[Any] = []
+            for i, cell in enumerate(row):
+                replaced = None
+                # Leave formulas and non-text cells untouched, matching
+                # the server-side includeFormulas=False behavior
+                if isinstance(cell, str) and cell[:1] != '=':
+                    if match_entire_cell:
+                        if pattern.fullmatch(cell):
+                            replaced = replace
+                            occurrences += 1
+                    else:
+                        new_cell, count = pattern.subn(replace, cell)
+                        if count:
+                            replaced = new_cell
+                            occurrences += count
+                if replaced is not None:
+                    if run_start is None:
+                        run_start = i
+                    run_values.append(replaced)
+                elif run_start is not None:
+                    changed_data.append(_cell_run_entry(
+                        prefix, row0 + r, col0 + run_start, run_values))
+                    run_start, run_values = None, []
+            if run_start is not None:
+                changed_data.append(_cell_run_entry(
+                    prefix, row0 + r, col0 + run_start, run_values))
+
+    if changed_data:
+        await client.execute(client._ss_values.batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={'valueInputOption': 'RAW', 'data': changed_data}
+        ))
+        client.invalidate_values_cache(spreadsheet_id)
+
+    return {
+        "occurrencesChanged": occurrences,
+        "find": find,
+        "replace": replace
+    }
+
 # ============================================================================
 # SORT OPERATIONS
 # ============================================================================
@@ -1872,17 +2765,11 @@ async def range_sort(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    sheet_name = range.split('!')[0] if '!' in range else 'Sheet1'
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    sheet_name = _split_a1(range)[0]
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
     sort_specs_formatted = []
     for spec in sort_specs:
@@ -1904,15 +2791,60 @@ async def range_sort(
         }
     }
     
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Sorted range {range}"
 
+# ============================================================================
+# BULK FORMAT OPERATIONS
+# ============================================================================
+
+@mcp.tool()
+async def bulk_format(
+    ctx: Context,
+    operations: List[Dict[str, Any]],
+    spreadsheet_id: Optional[str] = None
+) -> str:
+    """
+    Apply several formatting operations in one batchUpdate
+
+    Args:
+        operations: List of {'tool': name, 'args': {...}} descriptors.
+            Supported tools: cells_merge, cells_unmerge, borders_update,
+            validation_add, conditional_format_add, named_range_add.
+            Each args dict takes the same arguments as the standalone
+            tool (minus spreadsheet_id).
+        spreadsheet_id: Spreadsheet ID (uses current if not provided)
+
+    Returns:
+        Confirmation message
+    """
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
+
+    requests = []
+    for operation in operations:
+        tool = operation.get('tool')
+        builder = _FORMAT_REQUEST_BUILDERS.get(tool)
+        if builder is None:
+            raise ValueError(f"Unsupported bulk_format tool: {tool}")
+
+        args = dict(operation.get('args', {}))
+        range = args.pop('range', None)
+        if range is None:
+            raise ValueError(f"bulk_format operation '{tool}' is missing 'range'")
+
+        sheet_name = _split_a1(range)[0]
+        sheet_id = await client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
+        if sheet_id is None:
+            raise ValueError(f"Sheet '{sheet_name}' not found")
+
+        requests.append(builder(sheet_id, range, **args))
+
+    await client.queue_requests(spreadsheet_id, requests)
+
+    return f"Applied {len(requests)} formatting operation(s)"
+
 # ============================================================================
 # COPY/PASTE OPERATIONS
 # ============================================================================
@@ -1937,48 +2869,28 @@ async def range_copy_paste(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    source_sheet = source_range.split('!')[0] if '!' in source_range else 'Sheet1'
-    target_sheet = target_range.split('!')[0] if '!' in target_range else 'Sheet1'
+    source_sheet = _split_a1(source_range)[0]
+    target_sheet = _split_a1(target_range)[0]
     
-    source_sheet_id = client.get_sheet_id_by_name(spreadsheet_id, source_sheet)
-    target_sheet_id = client.get_sheet_id_by_name(spreadsheet_id, target_sheet)
+    source_sheet_id = await client.get_sheet_id_by_name(spreadsheet_id, source_sheet)
+    target_sheet_id = await client.get_sheet_id_by_name(spreadsheet_id, target_sheet)
     
     if source_sheet_id is None or target_sheet_id is None:
         raise ValueError("Sheet not found")
     
     request = {
         'copyPaste': {
-            'source': {
-                'sheetId': source_sheet_id,
-                'startRowIndex': 0,
-                'endRowIndex': 100,
-                'startColumnIndex': 0,
-                'endColumnIndex': 26
-            },
-            'destination': {
-                'sheetId': target_sheet_id,
-                'startRowIndex': 0,
-                'endRowIndex': 100,
-                'startColumnIndex': 0,
-                'endColumnIndex': 26
-            },
+            'source': _grid_range(source_sheet_id, source_range),
+            'destination': _grid_range(target_sheet_id, target_range),
             'pasteType': paste_type,
             'pasteOrientation': 'NORMAL'
         }
     }
     
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Copied {source_range} to {target_range}"
 
@@ -2000,45 +2912,34 @@ async def range_cut_paste(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    source_sheet = source_range.split('!')[0] if '!' in source_range else 'Sheet1'
-    target_sheet = target_range.split('!')[0] if '!' in target_range else 'Sheet1'
+    source_sheet = _split_a1(source_range)[0]
+    target_sheet = _split_a1(target_range)[0]
     
-    source_sheet_id = client.get_sheet_id_by_name(spreadsheet_id, source_sheet)
-    target_sheet_id = client.get_sheet_id_by_name(spreadsheet_id, target_sheet)
+    source_sheet_id = await client.get_sheet_id_by_name(spreadsheet_id, source_sheet)
+    target_sheet_id = await client.get_sheet_id_by_name(spreadsheet_id, target_sheet)
     
     if source_sheet_id is None or target_sheet_id is None:
         raise ValueError("Sheet not found")
     
+    # cutPaste destinations are a single anchor cell, not a range
+    target_cell = _split_a1(target_range)[1]
+    target_bounds = _parse_cell_span(target_cell) if target_cell else (0, 0, 0, 0)
     request = {
         'cutPaste': {
-            'source': {
-                'sheetId': source_sheet_id,
-                'startRowIndex': 0,
-                'endRowIndex': 100,
-                'startColumnIndex': 0,
-                'endColumnIndex': 26
-            },
+            'source': _grid_range(source_sheet_id, source_range),
             'destination': {
                 'sheetId': target_sheet_id,
-                'rowIndex': 0,
-                'columnIndex': 0
+                'rowIndex': target_bounds[0] or 0,
+                'columnIndex': target_bounds[2] or 0
             },
             'pasteType': 'PASTE_NORMAL'
         }
     }
     
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Cut {source_range} and pasted to {target_range}"
 
@@ -2068,14 +2969,13 @@ async def metadata_create(
     Returns:
         Metadata information
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_name = location.split('!')[0] if '!' in location else location
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
+    # location may be a bare sheet name, so a missing '!' keeps the
+    # whole string rather than falling back to a default sheet
+    sheet_name = location.partition('!')[0]
+    sheet_id = await client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
     
     metadata = {
         'metadataKey': key,
@@ -2094,13 +2994,9 @@ async def metadata_create(
         }
     }
     
-    body = {'requests': [request]}
-    
-    result = client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
-    
+    await client.queue_request(spreadsheet_id, request)
+    client._dm_cache.pop(spreadsheet_id, None)
+
     return {
         "key": key,
         "value": value,
@@ -2126,28 +3022,32 @@ async def metadata_search(
     Returns:
         List of matching metadata
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    data_filters = []
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
+    
+    # The unfiltered listing repeats often and only changes when this
+    # process creates metadata - serve it from cache between mutations
+    if key is None and value is None:
+        cached = client._dm_cache.get(spreadsheet_id)
+        if cached is not None:
+            return cached
+
+    lookup = {}
     if key:
-        data_filters.append({
-            'developerMetadataLookup': {
-                'metadataKey': key
-            }
-        })
-    
+        lookup['metadataKey'] = key
+    if value:
+        lookup['metadataValue'] = value
+
     body = {
-        'dataFilters': data_filters if data_filters else [{}]
+        'dataFilters': [{'developerMetadataLookup': lookup} if lookup else {}]
     }
-    
-    result = client.sheets_service.spreadsheets().developerMetadata().search(
+
+    result = await client.execute(client._ss_dm.search(
         spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+        body=body,
+        fields='matchedDeveloperMetadata(developerMetadata('
+               'metadataId,metadataKey,metadataValue,visibility))'
+    ))
     
     metadata_list = []
     for item in result.get('matchedDeveloperMetadata', []):
@@ -2158,7 +3058,10 @@ async def metadata_search(
             'value': dm.get('metadataValue'),
             'visibility': dm.get('visibility')
         })
-    
+
+    if key is None and value is None:
+        client._dm_cache[spreadsheet_id] = metadata_list
+
     return metadata_list
 
 # ============================================================================
@@ -2184,54 +3087,29 @@ async def banded_range_add(
         second_band_color: Second band color (hex)
         spreadsheet_id: Spreadsheet ID (uses current if not provided)
     
-    Returns:
-        Confirmation message
-    """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_name = range.split('!')[0] if '!' in range else 'Sheet1'
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
-    
-    def hex_to_rgb(hex_color):
-        hex_color = hex_color.lstrip('#')
-        return {
-            'red': int(hex_color[0:2], 16) / 255,
-            'green': int(hex_color[2:4], 16) / 255,
-            'blue': int(hex_color[4:6], 16) / 255
-        }
+    Returns:
+        Confirmation message
+    """
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
+    
+    sheet_name = _split_a1(range)[0]
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
     request = {
         'addBanding': {
             'bandedRange': {
-                'range': {
-                    'sheetId': sheet_id,
-                    'startRowIndex': 0,
-                    'endRowIndex': 100,
-                    'startColumnIndex': 0,
-                    'endColumnIndex': 26
-                },
+                'range': _grid_range(sheet_id, range),
                 'rowProperties': {
-                    'headerColor': hex_to_rgb(header_color),
-                    'firstBandColor': hex_to_rgb(first_band_color),
-                    'secondBandColor': hex_to_rgb(second_band_color)
+                    'headerColor': _hex_rgb(header_color),
+                    'firstBandColor': _hex_rgb(first_band_color),
+                    'secondBandColor': _hex_rgb(second_band_color)
                 }
             }
         }
     }
     
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Added banded range to {range}"
 
@@ -2251,11 +3129,8 @@ async def banded_range_remove(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
     request = {
         'deleteBanding': {
@@ -2263,12 +3138,7 @@ async def banded_range_remove(
         }
     }
     
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Removed banded range with ID: {banded_range_id}"
 
@@ -2294,22 +3164,20 @@ async def formula_add(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
     # Ensure formula starts with =
-    if not formula.startswith('='):
+    if formula[:1] != '=':
         formula = '=' + formula
     
-    result = client.sheets_service.spreadsheets().values().update(
+    result = await client.execute(client._ss_values.update(
         spreadsheetId=spreadsheet_id,
         range=cell,
         valueInputOption='USER_ENTERED',
         body={'values': [[formula]]}
-    ).execute()
+    ))
+    client.invalidate_values_cache(spreadsheet_id)
     
     return f"Added formula to {cell}: {formula}"
 
@@ -2331,26 +3199,24 @@ async def formula_array_add(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
     # Ensure formula starts with =
-    if not array_formula.startswith('='):
+    if array_formula[:1] != '=':
         array_formula = '=' + array_formula
     
-    # If not already an ARRAYFORMULA, wrap it
-    if 'ARRAYFORMULA' not in array_formula.upper():
+    # If the outer call is not already ARRAYFORMULA, wrap it
+    if not _outer_is_arrayformula(array_formula):
         array_formula = f"=ARRAYFORMULA({array_formula[1:]})"
     
-    result = client.sheets_service.spreadsheets().values().update(
+    result = await client.execute(client._ss_values.update(
         spreadsheetId=spreadsheet_id,
         range=range,
         valueInputOption='USER_ENTERED',
         body={'values': [[array_formula]]}
-    ).execute()
+    ))
+    client.invalidate_values_cache(spreadsheet_id)
     
     return f"Added array formula to {range}"
 
@@ -2378,11 +3244,8 @@ async def hyperlink_add(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
     # Create HYPERLINK formula
     if display_text:
@@ -2390,12 +3253,13 @@ async def hyperlink_add(
     else:
         formula = f'=HYPERLINK("{url}")'
     
-    result = client.sheets_service.spreadsheets().values().update(
+    result = await client.execute(client._ss_values.update(
         spreadsheetId=spreadsheet_id,
         range=cell,
         valueInputOption='USER_ENTERED',
         body={'values': [[formula]]}
-    ).execute()
+    ))
+    client.invalidate_values_cache(spreadsheet_id)
     
     return f"Added hyperlink to {cell}"
 
@@ -2421,22 +3285,12 @@ async def note_add(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_name = cell.split('!')[0] if '!' in cell else 'Sheet1'
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    # Parse cell reference
-    cell_ref = cell.split('!')[-1] if '!' in cell else cell
-    col = ord(cell_ref[0]) - ord('A')
-    row = int(cell_ref[1:]) - 1
+    sheet_name, cell_ref = _split_a1(cell)
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
+    row, col = _parse_cell(cell_ref)
     
     request = {
         'updateCells': {
@@ -2454,12 +3308,7 @@ async def note_add(
         }
     }
     
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Added note to {cell}"
 
@@ -2479,22 +3328,12 @@ async def note_clear(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_name = cell.split('!')[0] if '!' in cell else 'Sheet1'
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    # Parse cell reference
-    cell_ref = cell.split('!')[-1] if '!' in cell else cell
-    col = ord(cell_ref[0]) - ord('A')
-    row = int(cell_ref[1:]) - 1
+    sheet_name, cell_ref = _split_a1(cell)
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
+    row, col = _parse_cell(cell_ref)
     
     request = {
         'updateCells': {
@@ -2510,15 +3349,83 @@ async def note_clear(
         }
     }
     
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Cleared note from {cell}"
 
+@mcp.tool()
+async def notes_add_bulk(
+    ctx: Context,
+    notes: List[Dict[str, str]],
+    spreadsheet_id: Optional[str] = None
+) -> str:
+    """
+    Add notes to many cells in one request
+
+    Args:
+        notes: List of {'cell': 'Sheet1!A1', 'note': 'text'} entries
+        spreadsheet_id: Spreadsheet ID (uses current if not provided)
+
+    Returns:
+        Confirmation message
+    """
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
+
+    by_sheet: Dict[str, List[tuple]] = {}
+    for item in notes:
+        cell = item.get('cell')
+        if not cell:
+            raise ValueError("Each notes entry needs a 'cell'")
+        sheet_name, cell_ref = _split_a1(cell)
+        row, col = _parse_cell(cell_ref)
+        by_sheet.setdefault(sheet_name, []).append((row, col, item.get('note', '')))
+
+    # Compact sorted cells into rectangles: first merge horizontal runs,
+    # then stack runs of equal width that sit on consecutive rows, so
+    # A1..A50 or a full block becomes a single updateCells request
+    requests = []
+    for sheet_name, cells in by_sheet.items():
+        sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
+        cells.sort()
+
+        runs: List[list] = []
+        for row, col, note in cells:
+            if runs and runs[-1][0] == row and runs[-1][1] + len(runs[-1][2]) == col:
+                runs[-1][2].append(note)
+            else:
+                runs.append([row, col, [note]])
+
+        rects: List[list] = []
+        for row, col, run in runs:
+            if (rects
+                    and rects[-1][1] == col
+                    and len(rects[-1][2][0]) == len(run)
+                    and rects[-1][0] + len(rects[-1][2]) == row):
+                rects[-1][2].append(run)
+            else:
+                rects.append([row, col, [run]])
+
+        for start_row, start_col, note_rows in rects:
+            requests.append({
+                'updateCells': {
+                    'rows': [
+                        {'values': [{'note': note} for note in note_row]}
+                        for note_row in note_rows
+                    ],
+                    'fields': 'note',
+                    'start': {
+                        'sheetId': sheet_id,
+                        'rowIndex': start_row,
+                        'columnIndex': start_col
+                    }
+                }
+            })
+
+    await client.queue_requests(spreadsheet_id, requests)
+
+    return f"Added {len(notes)} note(s) in {len(requests)} request(s)"
+
 # ============================================================================
 # IMPORT/EXPORT OPERATIONS
 # ============================================================================
@@ -2528,35 +3435,45 @@ async def csv_import(
     ctx: Context,
     csv_data: str,
     sheet_name: str = "Imported Data",
-    spreadsheet_id: Optional[str] = None
+    spreadsheet_id: Optional[str] = None,
+    chunk_size: int = 5000
 ) -> Dict[str, Any]:
     """
     Import CSV data into a sheet
-    
+
     Args:
         csv_data: CSV formatted data
         sheet_name: Name for the sheet
         spreadsheet_id: Spreadsheet ID (uses current if not provided)
-    
+        chunk_size: Rows per upload request for large CSVs
+
     Returns:
         Import results
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    # Parse CSV
-    import csv
-    import io
-    
-    reader = csv.reader(io.StringIO(csv_data))
-    values = list(reader)
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
+    
+    # Parse with pandas' C engine when available - orders of magnitude
+    # faster than a Python-level csv.reader loop on large pastes.
+    # dtype=str and keep_default_na preserve cells exactly as typed.
+    # Ragged rows (or no pandas) fall back to the stdlib reader.
+    def _parse():
+        if pd is not None:
+            try:
+                frame = pd.read_csv(
+                    io.StringIO(csv_data), header=None, dtype=str,
+                    engine='c', keep_default_na=False, skip_blank_lines=False
+                )
+                return frame.values.tolist()
+            except Exception:
+                pass
+        return list(csv.reader(io.StringIO(csv_data)))
+
+    values = await asyncio.to_thread(_parse)
     
     # Create new sheet if needed
     try:
-        sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
+        sheet_id = await client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
         if sheet_id is None:
             # Create sheet
             request = {
@@ -2567,24 +3484,36 @@ async def csv_import(
                 }
             }
             body = {'requests': [request]}
-            client.sheets_service.spreadsheets().batchUpdate(
+            await client.execute(client._ss.batchUpdate(
                 spreadsheetId=spreadsheet_id,
                 body=body
-            ).execute()
+            ))
     except:
         pass
     
-    # Write data
+    # Write data. Small imports go up in one update; large ones are
+    # split into chunk_size-row appends so no single request blows the
+    # payload limit and Sheets can recalc incrementally. Appends run
+    # sequentially - INSERT_ROWS ordering depends on it.
     range_name = f"{sheet_name}!A1"
-    body = {'values': values}
-    
-    result = client.sheets_service.spreadsheets().values().update(
-        spreadsheetId=spreadsheet_id,
-        range=range_name,
-        valueInputOption='RAW',
-        body=body
-    ).execute()
-    
+    if len(values) <= chunk_size:
+        await client.execute(client._ss_values.update(
+            spreadsheetId=spreadsheet_id,
+            range=range_name,
+            valueInputOption='RAW',
+            body={'values': values}
+        ))
+    else:
+        for chunk in _chunked(values, chunk_size):
+            await client.execute(client._ss_values.append(
+                spreadsheetId=spreadsheet_id,
+                range=range_name,
+                valueInputOption='RAW',
+                insertDataOption='INSERT_ROWS',
+                body={'values': chunk}
+            ))
+    client.invalidate_values_cache(spreadsheet_id)
+
     return {
         "sheet": sheet_name,
         "rows_imported": len(values),
@@ -2595,40 +3524,39 @@ async def csv_import(
 async def data_export_csv(
     ctx: Context,
     range: str,
-    spreadsheet_id: Optional[str] = None
+    spreadsheet_id: Optional[str] = None,
+    value_render_option: str = "FORMATTED_VALUE"
 ) -> str:
     """
     Export range data as CSV
-    
+
     Args:
         range: Range to export (A1 notation)
         spreadsheet_id: Spreadsheet ID (uses current if not provided)
-    
+        value_render_option: How to render values; UNFORMATTED_VALUE
+            gives smaller responses for large numeric ranges
+
     Returns:
         CSV formatted data
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    result = client.sheets_service.spreadsheets().values().get(
-        spreadsheetId=spreadsheet_id,
-        range=range
-    ).execute()
-    
-    values = result.get('values', [])
-    
-    # Convert to CSV
-    import csv
-    import io
-    
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerows(values)
-    
-    return output.getvalue()
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
+
+    # Fetch in row windows and encode through one reused buffer so peak
+    # memory tracks the window size, not the whole range twice. The MCP
+    # result is a single string, so the final join is unavoidable.
+    parts: List[str] = []
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    async for row in client.iter_values(spreadsheet_id, range, value_render_option):
+        writer.writerow(row)
+        if buffer.tell() > 65536:
+            parts.append(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+    parts.append(buffer.getvalue())
+
+    return ''.join(parts)
 
 # ============================================================================
 # SHEET PROPERTIES OPERATIONS
@@ -2652,33 +3580,26 @@ async def sheet_rename(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, old_name)
+    sheet_id = await client.get_sheet_id_by_name(spreadsheet_id, old_name)
     if sheet_id is None:
         raise ValueError(f"Sheet '{old_name}' not found")
     
-    request = {
-        'updateSheetProperties': {
-            'properties': {
-                'sheetId': sheet_id,
-                'title': new_name
-            },
-            'fields': 'title'
-        }
-    }
-    
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    request = _sheet_props_request(sheet_id, 'title', title=new_name)
     
+    await client.queue_request(spreadsheet_id, request)
+
+    # Move the cache entries to the new name so neither lookup goes stale
+    sheet_id = client._sheet_id_cache.pop((spreadsheet_id, old_name), None)
+    if sheet_id is not None:
+        client._sheet_id_cache[(spreadsheet_id, new_name)] = sheet_id
+    props = client._sheet_props.pop((spreadsheet_id, old_name), None)
+    if props is not None:
+        props['title'] = new_name
+        client._sheet_props[(spreadsheet_id, new_name)] = props
+
     return f"Renamed sheet from '{old_name}' to '{new_name}'"
 
 @mcp.tool()
@@ -2697,33 +3618,24 @@ async def sheet_hide(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
-    
-    request = {
-        'updateSheetProperties': {
-            'properties': {
-                'sheetId': sheet_id,
-                'hidden': True
-            },
-            'fields': 'hidden'
-        }
-    }
-    
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
+
+    # Agents retry idempotent calls; skip the round trip when the
+    # cached state already matches
+    props = client._sheet_props.get((spreadsheet_id, sheet_name))
+    if props is not None and props.get('hidden'):
+        return f"Sheet already hidden: {sheet_name}"
+
+    request = _sheet_props_request(sheet_id, 'hidden', hidden=True)
+
+    await client.queue_request(spreadsheet_id, request)
+
+    if props is not None:
+        props['hidden'] = True
+
     return f"Hidden sheet: {sheet_name}"
 
 @mcp.tool()
@@ -2742,43 +3654,24 @@ async def sheet_unhide(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    # Need to get all sheets to find hidden ones
-    spreadsheet = client.sheets_service.spreadsheets().get(
-        spreadsheetId=spreadsheet_id
-    ).execute()
-    
-    sheet_id = None
-    for sheet in spreadsheet.get('sheets', []):
-        if sheet['properties']['title'] == sheet_name:
-            sheet_id = sheet['properties']['sheetId']
-            break
-    
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
-    
-    request = {
-        'updateSheetProperties': {
-            'properties': {
-                'sheetId': sheet_id,
-                'hidden': False
-            },
-            'fields': 'hidden'
-        }
-    }
-    
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
+    # Hidden sheets are in the cached properties, so no full metadata
+    # scan is needed to find them
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
+
+    props = client._sheet_props.get((spreadsheet_id, sheet_name))
+    if props is not None and not props.get('hidden', False):
+        return f"Sheet already visible: {sheet_name}"
+
+    request = _sheet_props_request(sheet_id, 'hidden', hidden=False)
+
+    await client.queue_request(spreadsheet_id, request)
+
+    if props is not None:
+        props['hidden'] = False
+
     return f"Unhidden sheet: {sheet_name}"
 
 @mcp.tool()
@@ -2799,32 +3692,14 @@ async def sheet_move(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    request = {
-        'updateSheetProperties': {
-            'properties': {
-                'sheetId': sheet_id,
-                'index': new_index
-            },
-            'fields': 'index'
-        }
-    }
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
-    body = {'requests': [request]}
+    request = _sheet_props_request(sheet_id, 'index', index=new_index)
     
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Moved sheet '{sheet_name}' to position {new_index}"
 
@@ -2850,35 +3725,25 @@ async def freeze_rows(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
-    
-    request = {
-        'updateSheetProperties': {
-            'properties': {
-                'sheetId': sheet_id,
-                'gridProperties': {
-                    'frozenRowCount': num_rows
-                }
-            },
-            'fields': 'gridProperties.frozenRowCount'
-        }
-    }
-    
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
+
+    props = client._sheet_props.get((spreadsheet_id, sheet_name))
+    if props is not None:
+        if props.get('gridProperties', {}).get('frozenRowCount', 0) == num_rows:
+            return f"'{sheet_name}' already has {num_rows} frozen row(s)"
+
+    request = _sheet_props_request(
+        sheet_id, 'gridProperties.frozenRowCount',
+        gridProperties={'frozenRowCount': num_rows})
+
+    await client.queue_request(spreadsheet_id, request)
+
+    if props is not None:
+        props.setdefault('gridProperties', {})['frozenRowCount'] = num_rows
+
     return f"Froze {num_rows} row(s) in '{sheet_name}'"
 
 @mcp.tool()
@@ -2899,35 +3764,25 @@ async def freeze_columns(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
-    
-    request = {
-        'updateSheetProperties': {
-            'properties': {
-                'sheetId': sheet_id,
-                'gridProperties': {
-                    'frozenColumnCount': num_columns
-                }
-            },
-            'fields': 'gridProperties.frozenColumnCount'
-        }
-    }
-    
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
+
+    props = client._sheet_props.get((spreadsheet_id, sheet_name))
+    if props is not None:
+        if props.get('gridProperties', {}).get('frozenColumnCount', 0) == num_columns:
+            return f"'{sheet_name}' already has {num_columns} frozen column(s)"
+
+    request = _sheet_props_request(
+        sheet_id, 'gridProperties.frozenColumnCount',
+        gridProperties={'frozenColumnCount': num_columns})
+
+    await client.queue_request(spreadsheet_id, request)
+
+    if props is not None:
+        props.setdefault('gridProperties', {})['frozenColumnCount'] = num_columns
+
     return f"Froze {num_columns} column(s) in '{sheet_name}'"
 
 # ============================================================================
@@ -2954,37 +3809,15 @@ async def rows_hide(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    request = {
-        'updateDimensionProperties': {
-            'range': {
-                'sheetId': sheet_id,
-                'dimension': 'ROWS',
-                'startIndex': start_row - 1,
-                'endIndex': end_row
-            },
-            'properties': {
-                'hiddenByUser': True
-            },
-            'fields': 'hiddenByUser'
-        }
-    }
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
-    body = {'requests': [request]}
+    request = _dimension_props_request(
+        sheet_id, 'ROWS', start_row - 1, end_row, 'hiddenByUser', _HIDDEN_TRUE)
     
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Hidden rows {start_row} to {end_row} in '{sheet_name}'"
 
@@ -3008,40 +3841,57 @@ async def rows_unhide(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
-    
-    request = {
-        'updateDimensionProperties': {
-            'range': {
-                'sheetId': sheet_id,
-                'dimension': 'ROWS',
-                'startIndex': start_row - 1,
-                'endIndex': end_row
-            },
-            'properties': {
-                'hiddenByUser': False
-            },
-            'fields': 'hiddenByUser'
-        }
-    }
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
-    body = {'requests': [request]}
+    request = _dimension_props_request(
+        sheet_id, 'ROWS', start_row - 1, end_row, 'hiddenByUser', _HIDDEN_FALSE)
     
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Unhidden rows {start_row} to {end_row} in '{sheet_name}'"
 
+@mcp.tool()
+async def rows_hide_many(
+    ctx: Context,
+    sheet_names: List[str],
+    start_row: int,
+    end_row: int,
+    spreadsheet_id: Optional[str] = None
+) -> str:
+    """
+    Hide the same row range across several sheets in one call
+
+    Args:
+        sheet_names: Sheets to hide the rows in
+        start_row: Starting row (1-based)
+        end_row: Ending row (1-based)
+        spreadsheet_id: Spreadsheet ID (uses current if not provided)
+
+    Returns:
+        Confirmation message
+    """
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
+
+    # Resolve every sheet concurrently (cache hits return immediately),
+    # then hide all ranges in a single batchUpdate round trip
+    sheet_ids = await asyncio.gather(*(
+        _resolve_sheet(client, spreadsheet_id, name) for name in sheet_names
+    ))
+
+    requests = [
+        _dimension_props_request(
+            sheet_id, 'ROWS', start_row - 1, end_row, 'hiddenByUser', _HIDDEN_TRUE)
+        for sheet_id in sheet_ids
+    ]
+
+    await client.queue_requests(spreadsheet_id, requests)
+
+    return f"Hidden rows {start_row} to {end_row} in {len(sheet_names)} sheet(s)"
+
 @mcp.tool()
 async def columns_hide(
     ctx: Context,
@@ -3062,40 +3912,18 @@ async def columns_hide(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
-    start_idx = ord(start_column) - ord('A')
-    end_idx = ord(end_column) - ord('A') + 1
-    
-    request = {
-        'updateDimensionProperties': {
-            'range': {
-                'sheetId': sheet_id,
-                'dimension': 'COLUMNS',
-                'startIndex': start_idx,
-                'endIndex': end_idx
-            },
-            'properties': {
-                'hiddenByUser': True
-            },
-            'fields': 'hiddenByUser'
-        }
-    }
+    start_idx = _col_index(start_column)
+    end_idx = _col_index(end_column) + 1
     
-    body = {'requests': [request]}
+    request = _dimension_props_request(
+        sheet_id, 'COLUMNS', start_idx, end_idx, 'hiddenByUser', _HIDDEN_TRUE)
     
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Hidden columns {start_column} to {end_column} in '{sheet_name}'"
 
@@ -3119,40 +3947,18 @@ async def columns_unhide(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
-    
-    start_idx = ord(start_column) - ord('A')
-    end_idx = ord(end_column) - ord('A') + 1
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
-    request = {
-        'updateDimensionProperties': {
-            'range': {
-                'sheetId': sheet_id,
-                'dimension': 'COLUMNS',
-                'startIndex': start_idx,
-                'endIndex': end_idx
-            },
-            'properties': {
-                'hiddenByUser': False
-            },
-            'fields': 'hiddenByUser'
-        }
-    }
+    start_idx = _col_index(start_column)
+    end_idx = _col_index(end_column) + 1
     
-    body = {'requests': [request]}
+    request = _dimension_props_request(
+        sheet_id, 'COLUMNS', start_idx, end_idx, 'hiddenByUser', _HIDDEN_FALSE)
     
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Unhidden columns {start_column} to {end_column} in '{sheet_name}'"
 
@@ -3180,37 +3986,15 @@ async def row_resize(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    request = {
-        'updateDimensionProperties': {
-            'range': {
-                'sheetId': sheet_id,
-                'dimension': 'ROWS',
-                'startIndex': row - 1,
-                'endIndex': row
-            },
-            'properties': {
-                'pixelSize': height
-            },
-            'fields': 'pixelSize'
-        }
-    }
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
-    body = {'requests': [request]}
+    request = _dimension_props_request(
+        sheet_id, 'ROWS', row - 1, row, 'pixelSize', {'pixelSize': height})
     
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Resized row {row} to {height}px in '{sheet_name}'"
 
@@ -3234,39 +4018,17 @@ async def column_resize(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    col_idx = ord(column) - ord('A')
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
-    request = {
-        'updateDimensionProperties': {
-            'range': {
-                'sheetId': sheet_id,
-                'dimension': 'COLUMNS',
-                'startIndex': col_idx,
-                'endIndex': col_idx + 1
-            },
-            'properties': {
-                'pixelSize': width
-            },
-            'fields': 'pixelSize'
-        }
-    }
+    col_idx = _col_index(column)
     
-    body = {'requests': [request]}
+    request = _dimension_props_request(
+        sheet_id, 'COLUMNS', col_idx, col_idx + 1, 'pixelSize', {'pixelSize': width})
     
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Resized column {column} to {width}px in '{sheet_name}'"
 
@@ -3294,39 +4056,60 @@ async def columns_autofit(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
-    start_idx = ord(start_column) - ord('A')
-    end_idx = ord(end_column) - ord('A') + 1
-    
-    request = {
-        'autoResizeDimensions': {
-            'dimensions': {
-                'sheetId': sheet_id,
-                'dimension': 'COLUMNS',
-                'startIndex': start_idx,
-                'endIndex': end_idx
-            }
-        }
-    }
+    start_idx = _col_index(start_column)
+    end_idx = _col_index(end_column) + 1
     
-    body = {'requests': [request]}
+    request = _build_autofit_request(sheet_id, 'COLUMNS', start_idx, end_idx)
     
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Auto-fitted columns {start_column} to {end_column} in '{sheet_name}'"
 
+@mcp.tool()
+async def dimensions_autofit(
+    ctx: Context,
+    sheet_name: str,
+    dimension: str = "BOTH",
+    start_index: Optional[int] = None,
+    end_index: Optional[int] = None,
+    spreadsheet_id: Optional[str] = None
+) -> str:
+    """
+    Auto-resize rows, columns, or both to fit content in one call
+
+    Args:
+        sheet_name: Sheet name
+        dimension: ROWS, COLUMNS, or BOTH
+        start_index: First row/column to fit (0-based, whole dimension if omitted)
+        end_index: Index past the last row/column to fit
+        spreadsheet_id: Spreadsheet ID (uses current if not provided)
+
+    Returns:
+        Confirmation message
+    """
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
+
+    dimensions = ('ROWS', 'COLUMNS') if dimension == 'BOTH' else (dimension,)
+    if any(d not in ('ROWS', 'COLUMNS') for d in dimensions):
+        raise ValueError(f"Invalid dimension: {dimension}")
+
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
+
+    requests = [
+        _build_autofit_request(sheet_id, d, start_index, end_index)
+        for d in dimensions
+    ]
+
+    await client.queue_requests(spreadsheet_id, requests)
+
+    return f"Auto-fitted {' and '.join(d.lower() for d in dimensions)} in '{sheet_name}'"
+
 # ============================================================================
 # GROUP/UNGROUP OPERATIONS
 # ============================================================================
@@ -3351,33 +4134,18 @@ async def rows_group(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
     request = {
         'addDimensionGroup': {
-            'range': {
-                'sheetId': sheet_id,
-                'dimension': 'ROWS',
-                'startIndex': start_row - 1,
-                'endIndex': end_row
-            }
+            'range': _dimension_range(sheet_id, 'ROWS', start_row - 1, end_row)
         }
     }
     
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Grouped rows {start_row} to {end_row} in '{sheet_name}'"
 
@@ -3401,36 +4169,21 @@ async def columns_group(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
     
-    start_idx = ord(start_column) - ord('A')
-    end_idx = ord(end_column) - ord('A') + 1
+    start_idx = _col_index(start_column)
+    end_idx = _col_index(end_column) + 1
     
     request = {
         'addDimensionGroup': {
-            'range': {
-                'sheetId': sheet_id,
-                'dimension': 'COLUMNS',
-                'startIndex': start_idx,
-                'endIndex': end_idx
-            }
+            'range': _dimension_range(sheet_id, 'COLUMNS', start_idx, end_idx)
         }
     }
     
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Grouped columns {start_column} to {end_column} in '{sheet_name}'"
 
@@ -3456,27 +4209,26 @@ async def range_duplicate(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    # Get values from source
-    values = client.sheets_service.spreadsheets().values().get(
-        spreadsheetId=spreadsheet_id,
-        range=source_range
-    ).execute().get('values', [])
-    
-    # Write to target
-    if values:
-        client.sheets_service.spreadsheets().values().update(
-            spreadsheetId=spreadsheet_id,
-            range=target_range,
-            valueInputOption='USER_ENTERED',
-            body={'values': values}
-        ).execute()
-    
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
+
+    # Server-side copyPaste moves the cells without ever pulling them
+    # to the client - one round trip and no cell payload on the wire
+    source_sheet_id = await _resolve_sheet(
+        client, spreadsheet_id, _split_a1(source_range)[0])
+    target_sheet_id = await _resolve_sheet(
+        client, spreadsheet_id, _split_a1(target_range)[0])
+
+    request = {
+        'copyPaste': {
+            'source': _grid_range(source_sheet_id, source_range),
+            'destination': _grid_range(target_sheet_id, target_range),
+            'pasteType': 'PASTE_NORMAL'
+        }
+    }
+
+    await client.queue_request(spreadsheet_id, request)
+
     return f"Duplicated {source_range} to {target_range}"
 
 # ============================================================================
@@ -3501,27 +4253,15 @@ async def text_rotate(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_name = range.split('!')[0] if '!' in range else 'Sheet1'
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
+    sheet_name = _split_a1(range)[0]
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
+
     request = {
         'repeatCell': {
-            'range': {
-                'sheetId': sheet_id,
-                'startRowIndex': 0,
-                'endRowIndex': 100,
-                'startColumnIndex': 0,
-                'endColumnIndex': 26
-            },
+            'range': _grid_range(sheet_id, range),
             'cell': {
                 'userEnteredFormat': {
                     'textRotation': {
@@ -3533,12 +4273,7 @@ async def text_rotate(
         }
     }
     
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Rotated text in {range} by {angle} degrees"
 
@@ -3560,27 +4295,15 @@ async def text_wrap(
     Returns:
         Confirmation message
     """
-    client = ctx.request_context.lifespan_context.sheets_client
-    spreadsheet_id = spreadsheet_id or client.current_spreadsheet_id
-    
-    if not spreadsheet_id:
-        raise ValueError("No spreadsheet_id provided and no current spreadsheet set")
-    
-    sheet_name = range.split('!')[0] if '!' in range else 'Sheet1'
-    sheet_id = client.get_sheet_id_by_name(spreadsheet_id, sheet_name)
-    
-    if sheet_id is None:
-        raise ValueError(f"Sheet '{sheet_name}' not found")
+    client = _client(ctx)
+    spreadsheet_id = _require_spreadsheet(client, spreadsheet_id)
     
+    sheet_name = _split_a1(range)[0]
+    sheet_id = await _resolve_sheet(client, spreadsheet_id, sheet_name)
+
     request = {
         'repeatCell': {
-            'range': {
-                'sheetId': sheet_id,
-                'startRowIndex': 0,
-                'endRowIndex': 100,
-                'startColumnIndex': 0,
-                'endColumnIndex': 26
-            },
+            'range': _grid_range(sheet_id, range),
             'cell': {
                 'userEnteredFormat': {
                     'wrapStrategy': wrap_strategy
@@ -3590,12 +4313,7 @@ async def text_wrap(
         }
     }
     
-    body = {'requests': [request]}
-    
-    client.sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=body
-    ).execute()
+    await client.queue_request(spreadsheet_id, request)
     
     return f"Set text wrapping to {wrap_strategy} in {range}"
 
@@ -3603,26 +4321,32 @@ async def text_wrap(
 # RESOURCES
 # ============================================================================
 
+# Both resource payloads are effectively constant; serialize them once
+# at import instead of on every lookup
+_SPREADSHEET_RESOURCE_TMPL = json.dumps({
+    "error": "Resource access not implemented - use spreadsheet_get_metadata tool instead",
+    "spreadsheet_id": "%s"
+}, indent=2)
+
+_SETTINGS_JSON = json.dumps({
+    "version": "1.0.0",
+    "api": "Google Sheets v4",
+    "operations": 60,
+    "auth": "OAuth 2.0",
+    "transports": ["stdio", "sse", "streamable-http"]
+}, indent=2)
+
 @mcp.resource("spreadsheet://{spreadsheet_id}")
 async def get_spreadsheet_resource(spreadsheet_id: str) -> str:
     """Get complete spreadsheet information as a resource"""
     # Note: Resources in FastMCP don't have access to context
     # This would need to be implemented differently or as a tool instead
-    return json.dumps({
-        "error": "Resource access not implemented - use spreadsheet_get_metadata tool instead",
-        "spreadsheet_id": spreadsheet_id
-    }, indent=2)
+    return _SPREADSHEET_RESOURCE_TMPL % spreadsheet_id
 
 @mcp.resource("config://settings")
 def get_settings() -> str:
     """Get current DocuGen settings"""
-    return json.dumps({
-        "version": "1.0.0",
-        "api": "Google Sheets v4",
-        "operations": 60,
-        "auth": "OAuth 2.0",
-        "transports": ["stdio", "sse", "streamable-http"]
-    }, indent=2)
+    return _SETTINGS_JSON
 
 # ============================================================================
 # PROMPTS
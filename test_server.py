@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Smoke checks for the DocuGen MCP server
+
+Verifies that the server module imports, the FastMCP instance is
+registered, and the key operations exist as module attributes. Makes
+no network calls, so it runs without credentials.
+"""
+
+import os
+import sys
+
+import docugen_mcp_server
+
+# FastMCP has changed where it keeps registered tools across versions;
+# probe the known names once. Module-level tuple so the loop reuses the
+# same interned attribute names every run.
+_TOOL_CONTAINER_ATTRS = ('tools', '_tool_handlers', 'tool_handlers', '_tools')
+
+KEY_OPERATIONS = frozenset({
+    'spreadsheet_create',
+    'spreadsheet_get_metadata',
+    'values_get',
+    'values_update',
+    'values_append',
+    'values_batch_update',
+    'batch_start',
+    'batch_commit',
+    'sheet_add',
+    'sheet_delete',
+    'format_cells',
+    'chart_create',
+    'find_replace',
+    'csv_import',
+    'data_export_csv',
+    'rows_hide',
+    'columns_autofit',
+    'range_duplicate',
+})
+
+
+def test_server() -> int:
+    """Run the smoke checks; returns a process exit code"""
+    # Local rebinds turn the repeated builtin lookups in the probe
+    # loops into LOAD_FAST instead of LOAD_GLOBAL
+    _getattr = getattr
+    _isinstance = isinstance
+
+    # Buffer everything and emit one write at the end - a single
+    # stdout lock acquisition and syscall instead of one per line
+    out = ["Checking DocuGen MCP server..."]
+
+    server = _getattr(docugen_mcp_server, 'mcp', None)
+    if server is None:
+        out.append("FAIL: module does not expose an 'mcp' server instance")
+        sys.stdout.write("\n".join(out) + "\n")
+        return 1
+    out.append(f"Server: {server.name}")
+
+    # getattr with a default is one C-level lookup; hasattr would build
+    # and swallow an AttributeError for each of the three missing names
+    for attr in _TOOL_CONTAINER_ATTRS:
+        tools_dict = _getattr(server, attr, None)
+        if _isinstance(tools_dict, dict):
+            out.append(f"Registered tools ({attr}): {len(tools_dict)}")
+            break
+    else:
+        out.append("Tool container not found on this FastMCP version (not fatal)")
+
+    # Set algebra against the module dict's keys view - no per-op
+    # probes and no throwaway set() built from a list each run
+    found = KEY_OPERATIONS & vars(docugen_mcp_server).keys()
+    missing = KEY_OPERATIONS - found
+
+    out.append(f"Key operations present: {len(found)}/{len(KEY_OPERATIONS)}")
+    for op in sorted(missing):
+        out.append(f"  MISSING: {op}")
+
+    # Filesystem probes stay inside the function and use os.path
+    # directly - one stat each, no PurePath allocations, and nothing
+    # touches the disk at import time
+    creds_path = os.getenv('GOOGLE_OAUTH_PATH')
+    if not creds_path:
+        out.append("Note: GOOGLE_OAUTH_PATH not set; auth untested")
+    elif not os.path.exists(creds_path):
+        out.append(f"WARNING: GOOGLE_OAUTH_PATH points to a missing file: {creds_path}")
+    else:
+        out.append("Credentials file found")
+        token_path = os.path.join(os.path.expanduser('~'), '.docugen', 'token.json')
+        if os.path.exists(token_path):
+            out.append("Saved token found")
+        else:
+            out.append("No saved token; first run will open the OAuth flow")
+
+    out.append("FAIL" if missing else "OK")
+    sys.stdout.write("\n".join(out) + "\n")
+    return 1 if missing else 0
+
+
+if __name__ == '__main__':
+    sys.exit(test_server())